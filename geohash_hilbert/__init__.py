@@ -20,15 +20,56 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from ._hilbert import decode, decode_exactly, encode
-from ._utils import hilbert_curve, neighbours, rectangle
+from ._aggregate import CellAggregator
+from ._encoder import Encoder
+from ._grid import Grid
+from ._hilbert import decode, decode_exactly, decode_exactly_many, encode
+from ._join import spatial_join
+from ._metrics import cell_areas, grid_distances, haversine_distances
+from ._partition import Partitioner
+from ._sort import (
+    hilbert_argsort,
+    hilbert_argsort_external,
+    hilbert_sort,
+    hilbert_sort_external,
+)
+from ._stream import (
+    compact_codes,
+    intersect_codes,
+    merge_codes,
+    union_codes,
+    unique_codes,
+)
+from ._tracker import Tracker
+from ._utils import bboxes, hilbert_curve, neighbours, rectangle, write_rectangles
 
 
 __all__ = [
+    "CellAggregator",
+    "Encoder",
+    "Grid",
+    "Partitioner",
+    "Tracker",
+    "bboxes",
+    "cell_areas",
+    "compact_codes",
     "decode_exactly",
+    "decode_exactly_many",
     "decode",
     "encode",
+    "grid_distances",
+    "haversine_distances",
+    "hilbert_argsort",
+    "hilbert_argsort_external",
     "hilbert_curve",
+    "hilbert_sort",
+    "hilbert_sort_external",
+    "intersect_codes",
+    "merge_codes",
     "neighbours",
     "rectangle",
+    "spatial_join",
+    "union_codes",
+    "unique_codes",
+    "write_rectangles",
 ]
@@ -0,0 +1,149 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from collections.abc import Sequence
+from typing import Optional
+
+from ._hilbert import _decode_ints, _encode_ints, _lvl_error
+from ._int2str import BitsPerChar, encode_int
+
+
+class CellAggregator:
+    """Count and sum (weighted) lng/lat positions per geohash cell
+
+    Positions are added in chunks and encoded straight to the integer hashcode of
+    their cell at the given `precision`. Every cell gets a slot in contiguous
+    `array` storage for its count and sum of weights. Partial aggregates, e.g.
+    from multiple processes (aggregators are picklable), can be combined with
+    `merge()`.
+
+    Parameters:
+        precision: int      The number of characters in a geohash
+        bits_per_char: int  The number of bits per coding character
+    """
+
+    def __init__(self, precision: int = 10, bits_per_char: BitsPerChar = 6) -> None:
+        assert precision > 0
+        assert bits_per_char in (2, 4, 6)
+
+        self.precision = precision
+        self.bits_per_char = bits_per_char
+        self._level = (precision * bits_per_char) >> 1
+
+        self._slots: dict[int, int] = {}  # hashcode -> slot
+        self._cells: list[int] = []  # slot -> hashcode
+        self._counts = array("q")
+        self._sums = array("d")
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def _slot(self, hashcode: int) -> int:
+        slot = self._slots.get(hashcode)
+        if slot is None:
+            slot = self._slots[hashcode] = len(self._cells)
+            self._cells.append(hashcode)
+            self._counts.append(0)
+            self._sums.append(0.0)
+        return slot
+
+    def add(
+        self,
+        lngs: Sequence[float],
+        lats: Sequence[float],
+        weights: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Add a chunk of lng/lat positions
+
+        Parameters:
+            lngs: Sequence[float]     Longitudes; between -180.0 and 180.0; WGS 84
+            lats: Sequence[float]     Latitudes; between -90.0 and 90.0; WGS 84
+            weights: Sequence[float]  Optional weight of every position; the sum
+                                      of a cell equals its count without weights.
+        """
+        if len(lngs) != len(lats) or (
+            weights is not None and len(weights) != len(lngs)
+        ):
+            raise ValueError("`lngs`, `lats` and `weights` must have the same length")
+
+        counts = self._counts
+        sums = self._sums
+        hashcodes = _encode_ints(lngs, lats, self._level)
+        if weights is None:
+            for hashcode in hashcodes:
+                slot = self._slot(hashcode)
+                counts[slot] += 1
+                sums[slot] += 1.0
+        else:
+            for hashcode, weight in zip(hashcodes, weights):
+                slot = self._slot(hashcode)
+                counts[slot] += 1
+                sums[slot] += weight
+
+    def merge(self, other: "CellAggregator") -> None:
+        """Add the counts and sums of `other` to this aggregator
+
+        Parameters:
+            other: CellAggregator  Aggregator with the same precision and bits_per_char.
+        """
+        if (other.precision, other.bits_per_char) != (
+            self.precision,
+            self.bits_per_char,
+        ):
+            raise ValueError("Can only merge aggregators of the same precision")
+
+        counts = self._counts
+        sums = self._sums
+        for hashcode, count, total in zip(other._cells, other._counts, other._sums):
+            slot = self._slot(hashcode)
+            counts[slot] += count
+            sums[slot] += total
+
+    def export(
+        self,
+    ) -> tuple[list[str], "array[int]", "array[float]", "array[float]"]:
+        """Export the aggregated cells in hilbert curve order
+
+        Returns:
+            Tuple[List[str], array[int], array[float], array[float]]:
+                (codes, counts, sums, bboxes), where `bboxes` holds the `rectangle`
+                bbox (min lng, min lat, max lng, max lat) of every cell flattened,
+                i.e. `bboxes[4 * i: 4 * i + 4]` is the bbox of `codes[i]`.
+        """
+        order = sorted(range(len(self._cells)), key=self._cells.__getitem__)
+        cells = [self._cells[slot] for slot in order]
+
+        codes = [
+            encode_int(cell, self.bits_per_char).rjust(self.precision, "0")
+            for cell in cells
+        ]
+        counts = array("q", [self._counts[slot] for slot in order])
+        sums = array("d", [self._sums[slot] for slot in order])
+
+        lng_err, lat_err = _lvl_error(self._level)
+        bboxes = array("d")
+        for lng, lat in zip(*_decode_ints(cells, self._level)):
+            bboxes.extend((lng, lat, lng + 2 * lng_err, lat + 2 * lat_err))
+
+        return codes, counts, sums, bboxes
@@ -0,0 +1,290 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from collections.abc import Iterable, Sequence
+from math import floor
+from typing import Literal, Optional
+
+from ._grid import Grid
+from ._hilbert import (
+    _decode_ints,
+    _encode_ints,
+    _hash2xy,
+    _LAT_INTERVAL,
+    _lvl_error,
+    _LNG_INTERVAL,
+    _xy2hash,
+    CYTHON_AVAILABLE,
+)
+from ._int2str import (
+    _decode_int4,
+    _decode_int16,
+    _decode_int64,
+    _encode_int4,
+    _encode_int16,
+    _encode_int64,
+    BitsPerChar,
+)
+from ._utils import _DIRECTIONS, Directions
+
+if CYTHON_AVAILABLE:
+    from ._hilbert import hash2xy_cython, MAX_BITS, xy2hash_cython
+
+
+Backend = Literal["cython", "python"]
+
+_ENCODE_INT = {2: _encode_int4, 4: _encode_int16, 6: _encode_int64}
+_DECODE_INT = {2: _decode_int4, 4: _decode_int16, 6: _decode_int64}
+
+
+class Encoder:
+    """Encode and decode geohashes of one fixed precision
+
+    All per-precision constants (number of bits, level and dim of the hilbert
+    curve, error-margins, the kernel and the character encoding) are computed
+    once, hence every call only pays for the actual transformation. Results
+    are the same as for the corresponding module level functions.
+
+    Parameters:
+        precision: int      The number of characters in a geohash
+        bits_per_char: int  The number of bits per coding character
+        backend: str        'cython' or 'python' kernel (default: cython if
+                            available and the geohash has at most 64 bit)
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
+    """
+
+    __slots__ = (
+        "_decode_int",
+        "_dim",
+        "_encode_int",
+        "_hash2xy",
+        "_lat_err",
+        "_lng_err",
+        "_xy2hash",
+        "backend",
+        "bits_per_char",
+        "grid",
+        "level",
+        "precision",
+    )
+
+    def __init__(
+        self,
+        precision: int = 10,
+        bits_per_char: BitsPerChar = 6,
+        backend: Optional[Backend] = None,
+        grid: Optional[Grid] = None,
+    ) -> None:
+        assert precision > 0
+        assert bits_per_char in (2, 4, 6)
+
+        bits = precision * bits_per_char
+        cython_possible = CYTHON_AVAILABLE and bits <= MAX_BITS
+        if backend is None:
+            backend = "cython" if cython_possible else "python"
+        elif backend == "cython" and not cython_possible:
+            raise ValueError("cython backend is not available for this precision")
+        elif backend not in ("cython", "python"):
+            raise ValueError("`backend` must be in {'cython', 'python'}")
+
+        self.precision = precision
+        self.bits_per_char = bits_per_char
+        self.backend = backend
+        self.grid = grid
+        self.level = bits >> 1
+
+        self._dim = 1 << self.level
+        self._lng_err, self._lat_err = _lvl_error(self.level)
+        self._encode_int = _ENCODE_INT[bits_per_char]
+        self._decode_int = _DECODE_INT[bits_per_char]
+        if backend == "cython":
+            self._xy2hash = xy2hash_cython
+            self._hash2xy = hash2xy_cython
+        else:
+            self._xy2hash = _xy2hash
+            self._hash2xy = _hash2xy
+
+    def __repr__(self) -> str:
+        return (
+            f"Encoder(precision={self.precision!r}, bits_per_char={self.bits_per_char!r}, "
+            f"backend={self.backend!r}, grid={self.grid!r})"
+        )
+
+    def encode(self, lng: float, lat: float) -> str:
+        """Encode a lng/lat position as a geohash, see `encode`
+
+        Parameters:
+            lng: float  Longitude; between -180.0 and 180.0; WGS 84
+            lat: float  Latitude; between -90.0 and 90.0; WGS 84
+
+        Returns:
+            str: geohash for lng/lat of length `precision`
+        """
+        x, y = self._coord2xy(lng, lat)
+        return self._xy2code(x, y)
+
+    def _coord2xy(self, lng: float, lat: float) -> tuple[int, int]:
+        """Convert a lng/lat position into the dim x dim-grid coordinate system"""
+        dim = self._dim
+        if self.grid is None:
+            assert _LNG_INTERVAL[0] <= lng <= _LNG_INTERVAL[1]
+            assert _LAT_INTERVAL[0] <= lat <= _LAT_INTERVAL[1]
+            return (
+                min(dim - 1, floor((lng + _LNG_INTERVAL[1]) / 360.0 * dim)),
+                min(dim - 1, floor((lat + _LAT_INTERVAL[1]) / 180.0 * dim)),
+            )
+        return self.grid.coord2int(lng, lat, dim)
+
+    def _xy2code(self, x: int, y: int) -> str:
+        """Convert a point in the dim x dim-grid coordinate system into its geohash"""
+        return self._encode_int(self._xy2hash(x, y, self._dim)).rjust(
+            self.precision, "0"
+        )
+
+    def _hash2code(self, hashcode: int) -> str:
+        """Convert a hashcode on the hilbert curve into its geohash"""
+        return self._encode_int(hashcode).rjust(self.precision, "0")
+
+    def decode(self, code: str) -> tuple[float, float]:
+        """Decode a geohash as a lng/lat position, see `decode`
+
+        Parameters:
+            code: str  The geohash to decode; of length `precision`
+
+        Returns:
+            Tuple[float, float]:  (lng, lat) coordinate for the geohash.
+        """
+        lng, lat, _lng_err, _lat_err = self.decode_exactly(code)
+        return lng, lat
+
+    def decode_exactly(self, code: str) -> tuple[float, float, float, float]:
+        """Decode a geohash as a lng/lat position with error-margins, see `decode_exactly`
+
+        Parameters:
+            code: str  The geohash to decode; of length `precision`
+
+        Returns:
+            Tuple[float, float, float, float]:  (lng, lat, lng-error, lat-error)
+        """
+        assert len(code) == self.precision
+
+        dim = self._dim
+        x, y = self._hash2xy(self._decode_int(code), dim)
+        if self.grid is not None:
+            return self.grid.cell(x, y, dim)
+
+        lng_err = self._lng_err
+        lat_err = self._lat_err
+        return (
+            x / dim * 360 - 180 + lng_err,
+            y / dim * 180 - 90 + lat_err,
+            lng_err,
+            lat_err,
+        )
+
+    def neighbours(self, code: str) -> dict[Directions, str]:
+        """Get the neighbouring geohashes for `code`, see `neighbours`
+
+        Parameters:
+            code: str  The geohash at the center; of length `precision`
+
+        Returns:
+            dict: geohashes in the neighborhood of `code`.
+        """
+        assert len(code) == self.precision
+
+        dim = self._dim
+        wraps = self.grid is None or self.grid.wraps
+        x, y = self._hash2xy(self._decode_int(code), dim)
+
+        neighbours_dict: dict[Directions, str] = {}
+        for direction, dx, dy in _DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if wraps:
+                nx %= dim
+            if 0 <= nx < dim and 0 <= ny < dim:
+                neighbours_dict[direction] = self._xy2code(nx, ny)
+        return neighbours_dict
+
+    def encode_many(self, lngs: Sequence[float], lats: Sequence[float]) -> list[str]:
+        """Encode many lng/lat positions as geohashes
+
+        With the cython backend (and no grid), all positions are encoded in one
+        pass of the bulk kernel.
+
+        Parameters:
+            lngs: Sequence[float]  Longitudes; between -180.0 and 180.0; WGS 84
+            lats: Sequence[float]  Latitudes; between -90.0 and 90.0; WGS 84
+
+        Returns:
+            List[str]: geohashes in the order of the input positions
+        """
+        if len(lngs) != len(lats):
+            raise ValueError("`lngs` and `lats` must have the same length")
+        if self.backend == "cython" and self.grid is None:
+            hash2code = self._hash2code
+            return [hash2code(h) for h in _encode_ints(lngs, lats, self.level)]
+
+        encode = self.encode
+        return [encode(lng, lat) for lng, lat in zip(lngs, lats)]
+
+    def decode_exactly_many(
+        self, codes: Iterable[str]
+    ) -> tuple["array[float]", "array[float]", "array[float]", "array[float]"]:
+        """Decode many geohashes as lng/lat positions with error-margins
+
+        With the cython backend (and no grid), all geohashes are decoded in one
+        pass of the bulk kernel.
+
+        Parameters:
+            codes: Iterable[str]  The geohashes to decode; of length `precision`
+
+        Returns:
+            Tuple[array[float], array[float], array[float], array[float]]:
+                (lngs, lats, lng-errors, lat-errors) of the geohashes.
+        """
+        if self.backend == "cython" and self.grid is None:
+            codes = list(codes)
+            assert all(len(code) == self.precision for code in codes)
+            decode_int = self._decode_int
+            lngs, lats = _decode_ints(map(decode_int, codes), self.level)
+            lng_err = self._lng_err
+            lat_err = self._lat_err
+            return (
+                array("d", [lng + lng_err for lng in lngs]),
+                array("d", [lat + lat_err for lat in lats]),
+                array("d", [lng_err]) * len(codes),
+                array("d", [lat_err]) * len(codes),
+            )
+
+        result = (array("d"), array("d"), array("d"), array("d"))
+        lngs, lats, lng_errs, lat_errs = result
+        decode_exactly = self.decode_exactly
+        for code in codes:
+            lng, lat, lng_err, lat_err = decode_exactly(code)
+            lngs.append(lng)
+            lats.append(lat)
+            lng_errs.append(lng_err)
+            lat_errs.append(lat_err)
+        return result
@@ -0,0 +1,175 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from math import atan, degrees, exp, floor, log, pi, radians, tan
+from typing import Optional
+
+
+# latitude, where web-mercator maps the globe onto a square
+MERCATOR_MAX_LAT = degrees(2 * atan(exp(pi)) - pi / 2)  # ~85.0511
+
+
+class Grid:
+    """The domain mapped onto the dim x dim-grid of the hilbert curve
+
+    By default, the whole globe is mapped onto the grid. For regional data a
+    smaller bounding box gives (much) smaller cells for the same precision,
+    e.g. to stay within the 64 bit of the cython kernel. With `mercator=True`
+    the latitudes are projected with web-mercator (EPSG:3857) before they are
+    mapped onto the grid, i.e. cells are (almost) square on web maps.
+
+    Geohashes of different grids cannot be compared. Do not mix them!
+
+    Parameters:
+        lng_min: float   West boundary; between -180.0 and 180.0; WGS 84
+        lat_min: float   South boundary; between -90.0 and 90.0; WGS 84
+                         (default: -90.0 or -MERCATOR_MAX_LAT with `mercator`)
+        lng_max: float   East boundary; between -180.0 and 180.0; WGS 84
+        lat_max: float   North boundary; between -90.0 and 90.0; WGS 84
+                         (default: 90.0 or MERCATOR_MAX_LAT with `mercator`)
+        mercator: bool   Project the latitudes with web-mercator.
+    """
+
+    __slots__ = (
+        "_height",
+        "_width",
+        "_y_min",
+        "lat_max",
+        "lat_min",
+        "lng_max",
+        "lng_min",
+        "mercator",
+        "wraps",
+    )
+
+    def __init__(
+        self,
+        lng_min: float = -180.0,
+        lat_min: Optional[float] = None,
+        lng_max: float = 180.0,
+        lat_max: Optional[float] = None,
+        mercator: bool = False,
+    ) -> None:
+        max_lat = MERCATOR_MAX_LAT if mercator else 90.0
+        if lat_min is None:
+            lat_min = -max_lat
+        if lat_max is None:
+            lat_max = max_lat
+
+        if not -180.0 <= lng_min < lng_max <= 180.0:
+            raise ValueError("Need -180 <= `lng_min` < `lng_max` <= 180")
+        if not -max_lat <= lat_min < lat_max <= max_lat:
+            raise ValueError(f"Need -{max_lat} <= `lat_min` < `lat_max` <= {max_lat}")
+
+        self.lng_min = lng_min
+        self.lat_min = lat_min
+        self.lng_max = lng_max
+        self.lat_max = lat_max
+        self.mercator = mercator
+        # neighbours wrap around the globe at the east/west edge
+        self.wraps = lng_min == -180.0 and lng_max == 180.0
+
+        self._width = lng_max - lng_min
+        self._y_min = self._project(lat_min)
+        self._height = self._project(lat_max) - self._y_min
+
+    def __repr__(self) -> str:
+        return (
+            f"Grid(lng_min={self.lng_min!r}, lat_min={self.lat_min!r}, "
+            f"lng_max={self.lng_max!r}, lat_max={self.lat_max!r}, "
+            f"mercator={self.mercator!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple[float, float, float, float, bool]:
+        return self.lng_min, self.lat_min, self.lng_max, self.lat_max, self.mercator
+
+    def _project(self, lat: float) -> float:
+        if self.mercator:
+            return log(tan(pi / 4 + radians(lat) / 2))
+        return lat
+
+    def _unproject(self, y: float) -> float:
+        if self.mercator:
+            return degrees(2 * atan(exp(y)) - pi / 2)
+        return y
+
+    def coord2int(self, lng: float, lat: float, dim: int) -> tuple[int, int]:
+        """Convert lon, lat values into a dim x dim-grid coordinate system.
+
+        Parameters:
+            lng: float    Longitude value of coordinate within the grid; X axis
+            lat: float    Latitude value of coordinate within the grid; Y axis
+            dim: int      Number of coding points each x, y value can take.
+                          Corresponds to 2^level of the hilbert curve.
+
+        Returns:
+            Tuple[int, int]: (x, y) lower left corner of the dim x dim-grid box
+        """
+        assert dim >= 1
+        assert self.lng_min <= lng <= self.lng_max
+        assert self.lat_min <= lat <= self.lat_max
+
+        lng_x = (lng - self.lng_min) / self._width * dim  # [0 ... dim)
+        lat_y = (self._project(lat) - self._y_min) / self._height * dim  # [0 ... dim)
+
+        return min(dim - 1, floor(lng_x)), min(dim - 1, floor(lat_y))
+
+    def cell(self, x: int, y: int, dim: int) -> tuple[float, float, float, float]:
+        """Get the center and error-margins of a cell of the dim x dim-grid
+
+        Parameters:
+            x: int        x value of point [0, dim); corresponds to longitude
+            y: int        y value of point [0, dim); corresponds to latitude
+            dim: int      Number of coding points each x, y value can take.
+                          Corresponds to 2^level of the hilbert curve.
+
+        Returns:
+            Tuple[float, float, float, float]:  (lng, lat, lng-error, lat-error)
+        """
+        assert dim >= 1
+        assert x < dim
+        assert y < dim
+
+        lng_err = self._width / 2 / dim
+        lng = x / dim * self._width + self.lng_min + lng_err
+
+        if not self.mercator:
+            lat_err = self._height / 2 / dim
+            return (
+                lng,
+                y / dim * self._height + self.lat_min + lat_err,
+                lng_err,
+                lat_err,
+            )
+
+        south = self._unproject(y / dim * self._height + self._y_min)
+        north = self._unproject((y + 1) / dim * self._height + self._y_min)
+        return lng, (south + north) / 2, lng_err, (north - south) / 2
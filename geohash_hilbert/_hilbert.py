@@ -20,12 +20,23 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from array import array
+from collections.abc import Iterable, Sequence
 from math import floor
+from typing import Any, Optional
 
+from ._grid import Grid
 from ._int2str import BitsPerChar, decode_int, encode_int
 
 try:
-    from geohash_hilbert._hilbert_cython import hash2xy_cython, MAX_BITS, xy2hash_cython
+    from geohash_hilbert._hilbert_cython import (
+        decode_many_cython,
+        encode_many_cython,
+        hash2xy_cython,
+        hash2xy_many_cython,
+        MAX_BITS,
+        xy2hash_cython,
+    )
 
     CYTHON_AVAILABLE = True
 except ImportError:
@@ -37,7 +48,11 @@ _LNG_INTERVAL = (-180.0, 180.0)
 
 
 def encode(
-    lng: float, lat: float, precision: int = 10, bits_per_char: BitsPerChar = 6
+    lng: float,
+    lat: float,
+    precision: int = 10,
+    bits_per_char: BitsPerChar = 6,
+    grid: Optional[Grid] = None,
 ) -> str:
     """Encode a lng/lat position as a geohash using a hilbert curve
 
@@ -47,18 +62,18 @@ def encode(
     the lng/lat coordinate using `precision` * `bits_per_char` bits. The number of
     bits devided by 2 give the level of the used hilbert curve, e.g. precision=10, bits_per_char=6
     (default values) use 60 bit and a level 30 hilbert curve to map the globe.
+    Pass a `grid` to map only a region (or a web-mercator projection) instead.
 
     Parameters:
         lng: float          Longitude; between -180.0 and 180.0; WGS 84
         lat: float          Latitude; between -90.0 and 90.0; WGS 84
         precision: int      The number of characters in a geohash
         bits_per_char: int  The number of bits per coding character
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
 
     Returns:
         str: geohash for lng/lat of length `precision`
     """
-    assert _LNG_INTERVAL[0] <= lng <= _LNG_INTERVAL[1]
-    assert _LAT_INTERVAL[0] <= lat <= _LAT_INTERVAL[1]
     assert precision > 0
     assert bits_per_char in (2, 4, 6)
 
@@ -66,7 +81,12 @@ def encode(
     level = bits >> 1
     dim = 1 << level
 
-    x, y = _coord2int(lng, lat, dim)
+    if grid is None:
+        assert _LNG_INTERVAL[0] <= lng <= _LNG_INTERVAL[1]
+        assert _LAT_INTERVAL[0] <= lat <= _LAT_INTERVAL[1]
+        x, y = _coord2int(lng, lat, dim)
+    else:
+        x, y = grid.coord2int(lng, lat, dim)
 
     if CYTHON_AVAILABLE and bits <= MAX_BITS:
         code = xy2hash_cython(x, y, dim)
@@ -76,7 +96,9 @@ def encode(
     return encode_int(code, bits_per_char).rjust(precision, "0")
 
 
-def decode(code: str, bits_per_char: BitsPerChar = 6) -> tuple[float, float]:
+def decode(
+    code: str, bits_per_char: BitsPerChar = 6, grid: Optional[Grid] = None
+) -> tuple[float, float]:
     """Decode a geohash on a hilbert curve as a lng/lat position
 
     Decodes the geohash `code` as a lng/lat position. It assumes, that
@@ -87,21 +109,22 @@ def decode(code: str, bits_per_char: BitsPerChar = 6) -> tuple[float, float]:
     Parameters:
         code: str           The geohash to decode.
         bits_per_char: int  The number of bits per coding character
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
 
     Returns:
         Tuple[float, float]:  (lng, lat) coordinate for the geohash.
     """
     assert bits_per_char in (2, 4, 6)
 
-    if len(code) == 0:
+    if len(code) == 0 and grid is None:
         return 0.0, 0.0
 
-    lng, lat, _lng_err, _lat_err = decode_exactly(code, bits_per_char)
+    lng, lat, _lng_err, _lat_err = decode_exactly(code, bits_per_char, grid)
     return lng, lat
 
 
 def decode_exactly(
-    code: str, bits_per_char: BitsPerChar = 6
+    code: str, bits_per_char: BitsPerChar = 6, grid: Optional[Grid] = None
 ) -> tuple[float, float, float, float]:
     """Decode a geohash on a hilbert curve as a lng/lat position with error-margins
 
@@ -113,29 +136,237 @@ def decode_exactly(
     Parameters:
         code: str           The geohash to decode.
         bits_per_char: int  The number of bits per coding character
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
 
     Returns:
         Tuple[float, float, float, float]:  (lng, lat, lng-error, lat-error) coordinate for the geohash.
     """
     assert bits_per_char in (2, 4, 6)
 
-    if len(code) == 0:
+    if len(code) == 0 and grid is None:
         return 0.0, 0.0, _LNG_INTERVAL[1], _LAT_INTERVAL[1]
 
+    x, y, dim = _code2xy(code, bits_per_char)
+    if grid is not None:
+        return grid.cell(x, y, dim)
+
+    level = dim.bit_length() - 1
+    lng, lat = _int2coord(x, y, dim)
+    lng_err, lat_err = _lvl_error(level)  # level of hilbert curve is bits / 2
+
+    return lng + lng_err, lat + lat_err, lng_err, lat_err
+
+
+def _code2xy(code: str, bits_per_char: BitsPerChar) -> tuple[int, int, int]:
+    """Convert a geohash to its (x, y) point in the dim x dim-grid system
+
+    Parameters:
+        code: str           The geohash to convert.
+        bits_per_char: int  The number of bits per coding character
+
+    Returns:
+        Tuple[int, int, int]: (x, y, dim) point in dim x dim-grid system
+    """
     bits = len(code) * bits_per_char
-    level = bits >> 1
-    dim = 1 << level
+    dim = 1 << (bits >> 1)
 
     code_int = decode_int(code, bits_per_char)
     if CYTHON_AVAILABLE and bits <= MAX_BITS:
         x, y = hash2xy_cython(code_int, dim)
     else:
         x, y = _hash2xy(code_int, dim)
+    return x, y, dim
 
-    lng, lat = _int2coord(x, y, dim)
-    lng_err, lat_err = _lvl_error(level)  # level of hilbert curve is bits / 2
 
-    return lng + lng_err, lat + lat_err, lng_err, lat_err
+def _xy2code(x: int, y: int, dim: int, bits_per_char: BitsPerChar) -> str:
+    """Convert an (x, y) point in the dim x dim-grid system to its geohash
+
+    Parameters:
+        x: int              x value of point [0, dim) in dim x dim coord system
+        y: int              y value of point [0, dim) in dim x dim coord system
+        dim: int            Number of coding points each x, y value can take.
+        bits_per_char: int  The number of bits per coding character
+
+    Returns:
+        str: geohash of the point
+    """
+    bits = 2 * (dim.bit_length() - 1)
+    if CYTHON_AVAILABLE and bits <= MAX_BITS:
+        code = xy2hash_cython(x, y, dim)
+    else:
+        code = _xy2hash(x, y, dim)
+    return encode_int(code, bits_per_char).rjust(bits // bits_per_char, "0")
+
+
+def decode_exactly_many(
+    codes: Iterable[str], bits_per_char: BitsPerChar = 6
+) -> tuple["array[float]", "array[float]", "array[float]", "array[float]"]:
+    """Decode many geohashes on a hilbert curve as lng/lat positions with error-margins
+
+    Batch version of `decode_exactly`: the same assumptions apply to every
+    code in `codes`. The codes may have different lengths; the codes of every
+    length are decoded in one pass of the bulk kernel (see `_decode_ints`).
+
+    Parameters:
+        codes: Iterable[str]  The geohashes to decode.
+        bits_per_char: int    The number of bits per coding character
+
+    Returns:
+        Tuple[array[float], array[float], array[float], array[float]]:
+            (lngs, lats, lng-errors, lat-errors) of the geohashes.
+    """
+    assert bits_per_char in (2, 4, 6)
+
+    # codes of the same length are decoded at once by the bulk kernel
+    codes = list(codes)
+    groups: dict[int, list[int]] = {}
+    for i, code in enumerate(codes):
+        groups.setdefault(len(code), []).append(i)
+
+    n = len(codes)
+    lngs = array("d", bytes(8 * n))
+    lats = array("d", bytes(8 * n))
+    lng_errs = array("d", bytes(8 * n))
+    lat_errs = array("d", bytes(8 * n))
+    for length, indices in groups.items():
+        level = (length * bits_per_char) >> 1
+        lng_err, lat_err = _lvl_error(level)
+        group_lngs, group_lats = _decode_ints(
+            [decode_int(codes[i], bits_per_char) for i in indices], level
+        )
+        if len(indices) == n:
+            lngs = array("d", [lng + lng_err for lng in group_lngs])
+            lats = array("d", [lat + lat_err for lat in group_lats])
+            lng_errs = array("d", [lng_err]) * n
+            lat_errs = array("d", [lat_err]) * n
+            break
+
+        for i, lng, lat in zip(indices, group_lngs, group_lats):
+            lngs[i] = lng + lng_err
+            lats[i] = lat + lat_err
+            lng_errs[i] = lng_err
+            lat_errs[i] = lat_err
+
+    return lngs, lats, lng_errs, lat_errs
+
+
+def _encode_ints(
+    lngs: Iterable[float], lats: Iterable[float], level: int
+) -> Sequence[int]:
+    """Encode many lng/lat positions as hashcodes on a hilbert curve of level `level`
+
+    Up to 64 bit, the cython bulk kernel encodes all positions at once, otherwise
+    the kernel (cython or pure python) is chosen once for all positions. Both raise
+    a ValueError for positions out of range.
+
+    Parameters:
+        lngs: Iterable[float]  Longitudes; between -180.0 and 180.0; WGS 84
+        lats: Iterable[float]  Latitudes; between -90.0 and 90.0; WGS 84
+        level: int             Level of the used hilbert curve
+
+    Returns:
+        Sequence[int]: hashcodes ∈ [0, 4**level) in the order of the input positions
+    """
+    dim = 1 << level
+    if CYTHON_AVAILABLE and 2 * level <= MAX_BITS:
+        lngs_buf = _float_buffer(lngs)
+        lats_buf = _float_buffer(lats)
+        if len(lngs_buf) != len(lats_buf):
+            raise ValueError("`lngs` and `lats` must have the same length")
+        out = array("Q", bytes(8 * len(lngs_buf)))
+        encode_many_cython(lngs_buf, lats_buf, dim, out)
+        return out
+
+    lngs = list(lngs)
+    lats = list(lats)
+    if len(lngs) != len(lats):
+        raise ValueError("`lngs` and `lats` must have the same length")
+
+    codes = []
+    for lng, lat in zip(lngs, lats):
+        if not (
+            _LNG_INTERVAL[0] <= lng <= _LNG_INTERVAL[1]
+            and _LAT_INTERVAL[0] <= lat <= _LAT_INTERVAL[1]
+        ):
+            raise ValueError(f"Position ({lng}, {lat}) is out of range")
+        x, y = _coord2int(lng, lat, dim)
+        codes.append(_xy2hash(x, y, dim))
+    return codes
+
+
+def _decode_ints(
+    hashcodes: Iterable[int], level: int
+) -> tuple["array[float]", "array[float]"]:
+    """Decode many hashcodes on a hilbert curve of level `level` as lng/lat positions
+
+    Up to 64 bit, the cython bulk kernel decodes all hashcodes at once, otherwise
+    the kernel (cython or pure python) is chosen once for all hashcodes. Like
+    `_int2coord`, the lower left corner of every cell is returned, i.e. add the
+    `_lvl_error` to get the center of the cell.
+
+    Parameters:
+        hashcodes: Iterable[int]  Hashcodes to decode [0, 4**level)
+        level: int                Level of the used hilbert curve
+
+    Returns:
+        Tuple[array[float], array[float]]: (lngs, lats) of the lower left corners
+    """
+    dim = 1 << level
+    if CYTHON_AVAILABLE and 2 * level <= MAX_BITS:
+        hashcodes_buf = array("Q", hashcodes)
+        lngs = array("d", bytes(8 * len(hashcodes_buf)))
+        lats = array("d", bytes(8 * len(hashcodes_buf)))
+        decode_many_cython(hashcodes_buf, dim, lngs, lats)
+        return lngs, lats
+
+    lngs = array("d")
+    lats = array("d")
+    for hashcode in hashcodes:
+        x, y = _hash2xy(hashcode, dim)
+        lngs.append(x / dim * 360 - 180)
+        lats.append(y / dim * 180 - 90)
+    return lngs, lats
+
+
+def _hash2xy_many(
+    hashcodes: Iterable[int], level: int
+) -> tuple[Sequence[int], Sequence[int]]:
+    """Convert many hashcodes on a hilbert curve of level `level` to (x, y) points
+
+    Up to 64 bit, the cython bulk kernel converts all hashcodes at once, otherwise
+    the pure python kernel is used for every hashcode.
+
+    Parameters:
+        hashcodes: Iterable[int]  Hashcodes to convert [0, 4**level)
+        level: int                Level of the used hilbert curve
+
+    Returns:
+        Tuple[Sequence[int], Sequence[int]]: (xs, ys) in the dim x dim-grid system
+    """
+    dim = 1 << level
+    if CYTHON_AVAILABLE and 2 * level <= MAX_BITS:
+        hashcodes_buf = array("Q", hashcodes)
+        xs = array("Q", bytes(8 * len(hashcodes_buf)))
+        ys = array("Q", bytes(8 * len(hashcodes_buf)))
+        hash2xy_many_cython(hashcodes_buf, dim, xs, ys)
+        return xs, ys
+
+    points = [_hash2xy(hashcode, dim) for hashcode in hashcodes]
+    return [x for x, _y in points], [y for _x, y in points]
+
+
+def _float_buffer(values: Iterable[float]) -> Any:
+    """Get a float64 buffer of `values` for the cython bulk kernels
+
+    Buffers of float64 (e.g. `array('d')` or numpy arrays) are used without a copy.
+    """
+    try:
+        view = memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        return array("d", values)
+    if view.format == "d" and view.ndim == 1:
+        return values
+    return array("d", values)
 
 
 def _lvl_error(level: int) -> tuple[float, float]:
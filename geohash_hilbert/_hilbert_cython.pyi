@@ -1,4 +1,15 @@
+from typing_extensions import Buffer
+
 MAX_BITS: int
 
 def xy2hash_cython(x: int, y: int, dim: int) -> int: ...
 def hash2xy_cython(hashcode: int, dim: int) -> tuple[int, int]: ...
+def xy2hash_many_cython(x: Buffer, y: Buffer, dim: int, out: Buffer) -> None: ...
+def hash2xy_many_cython(hashcodes: Buffer, dim: int, x: Buffer, y: Buffer) -> None: ...
+def encode_many_cython(lngs: Buffer, lats: Buffer, dim: int, out: Buffer) -> None: ...
+def decode_many_cython(
+    hashcodes: Buffer, dim: int, lngs: Buffer, lats: Buffer
+) -> None: ...
+def lookup_ranges_cython(
+    hashcodes: Buffer, starts: Buffer, lasts: Buffer, indices: Buffer, out: Buffer
+) -> None: ...
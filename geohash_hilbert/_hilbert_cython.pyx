@@ -20,6 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+cimport cython
+from libc.math cimport floor
+
 
 ctypedef unsigned long long ghh_uint
 MAX_BITS = sizeof(ghh_uint) * 8
@@ -96,6 +99,173 @@ cpdef hash2xy_cython(ghh_uint hashcode, const ghh_uint dim):
     return x, y
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def xy2hash_many_cython(
+    const ghh_uint[:] x, const ghh_uint[:] y, const ghh_uint dim, ghh_uint[:] out
+) -> None:
+    '''Convert many (x, y) to hashcodes.
+
+    Bulk version of `xy2hash_cython` on typed memoryviews, i.e. any buffer of
+    uint64 (`array('Q')`, numpy arrays, ...). The hashcodes are written into
+    the caller-provided buffer `out`.
+
+    Parameters:
+        x: uint64[:]    x values of points [0, dim) in dim x dim coord system
+        y: uint64[:]    y values of points [0, dim) in dim x dim coord system
+        dim: int        Number of coding points each x, y value can take.
+                        Corresponds to 2^level of the hilbert curve.
+        out: uint64[:]  Output buffer for the hashcodes ∈ [0, dim**2)
+    '''
+    cdef Py_ssize_t i, n = x.shape[0]
+    if y.shape[0] != n or out.shape[0] != n:
+        raise ValueError('All buffers must have the same length')
+
+    for i in range(n):
+        out[i] = cy_xy2hash_cython(x[i], y[i], dim)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def hash2xy_many_cython(
+    const ghh_uint[:] hashcodes, const ghh_uint dim, ghh_uint[:] x, ghh_uint[:] y
+) -> None:
+    '''Convert many hashcodes to (x, y).
+
+    Bulk version of `hash2xy_cython` on typed memoryviews, i.e. any buffer of
+    uint64 (`array('Q')`, numpy arrays, ...). The points are written into the
+    caller-provided buffers `x` and `y`.
+
+    Parameters:
+        hashcodes: uint64[:]  Hashcodes to decode [0, dim**2)
+        dim: int              Number of coding points each x, y value can take.
+                              Corresponds to 2^level of the hilbert curve.
+        x: uint64[:]          Output buffer for the x values
+        y: uint64[:]          Output buffer for the y values
+    '''
+    cdef Py_ssize_t i, n = hashcodes.shape[0]
+    if x.shape[0] != n or y.shape[0] != n:
+        raise ValueError('All buffers must have the same length')
+
+    for i in range(n):
+        cy_hash2xy_cython(hashcodes[i], dim, &x[i], &y[i])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def encode_many_cython(
+    const double[:] lngs, const double[:] lats, const ghh_uint dim, ghh_uint[:] out
+) -> None:
+    '''Convert many lng/lat positions to hashcodes.
+
+    Runs the lng/lat -> dim x dim-grid -> hashcode pipeline on typed memoryviews,
+    i.e. any buffer of float64 / uint64 (`array('d')`, `array('Q')`, numpy arrays, ...).
+    The hashcodes are written into the caller-provided buffer `out`.
+
+    Parameters:
+        lngs: float64[:]  Longitudes; between -180.0 and 180.0; WGS 84
+        lats: float64[:]  Latitudes; between -90.0 and 90.0; WGS 84
+        dim: int          Number of coding points each x, y value can take.
+                          Corresponds to 2^level of the hilbert curve.
+        out: uint64[:]    Output buffer for the hashcodes ∈ [0, dim**2)
+    '''
+    cdef Py_ssize_t i, n = lngs.shape[0]
+    cdef double lng, lat
+    cdef ghh_uint x, y
+
+    if lats.shape[0] != n or out.shape[0] != n:
+        raise ValueError('All buffers must have the same length')
+
+    for i in range(n):
+        lng = lngs[i]
+        lat = lats[i]
+        if not (-180.0 <= lng <= 180.0 and -90.0 <= lat <= 90.0):
+            raise ValueError(f'Position ({lng}, {lat}) is out of range')
+
+        x = <ghh_uint>floor((lng + 180.0) / 360.0 * dim)
+        y = <ghh_uint>floor((lat + 90.0) / 180.0 * dim)
+        out[i] = cy_xy2hash_cython(min(dim - 1, x), min(dim - 1, y), dim)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def decode_many_cython(
+    const ghh_uint[:] hashcodes, const ghh_uint dim, double[:] lngs, double[:] lats
+) -> None:
+    '''Convert many hashcodes to lng/lat positions.
+
+    Runs the hashcode -> dim x dim-grid -> lng/lat pipeline on typed memoryviews,
+    i.e. any buffer of uint64 / float64 (`array('Q')`, `array('d')`, numpy arrays, ...).
+    The lower left corners of the cells are written into the caller-provided
+    buffers `lngs` and `lats`.
+
+    Parameters:
+        hashcodes: uint64[:]  Hashcodes to decode [0, dim**2)
+        dim: int              Number of coding points each x, y value can take.
+                              Corresponds to 2^level of the hilbert curve.
+        lngs: float64[:]      Output buffer for the longitudes
+        lats: float64[:]      Output buffer for the latitudes
+    '''
+    cdef Py_ssize_t i, n = hashcodes.shape[0]
+    cdef ghh_uint x, y
+
+    if lngs.shape[0] != n or lats.shape[0] != n:
+        raise ValueError('All buffers must have the same length')
+
+    for i in range(n):
+        cy_hash2xy_cython(hashcodes[i], dim, &x, &y)
+        lngs[i] = <double>x / dim * 360 - 180
+        lats[i] = <double>y / dim * 180 - 90
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def lookup_ranges_cython(
+    const ghh_uint[:] hashcodes,
+    const ghh_uint[:] starts,
+    const ghh_uint[:] lasts,
+    const long long[:] indices,
+    long long[:] out,
+) -> None:
+    '''Find the range containing each hashcode.
+
+    For every hashcode with `out[i] < 0`, the range [starts[j], lasts[j]] containing
+    it is searched by bisection and `indices[j]` is written into `out[i]`. Entries
+    of `out`, that are already set (>= 0) or have no containing range, are kept,
+    i.e. several calls can be chained, e.g. from finest to coarsest ranges.
+
+    Parameters:
+        hashcodes: uint64[:]  Hashcodes to look up
+        starts: uint64[:]     Sorted first hashcodes of disjoint ranges
+        lasts: uint64[:]      Last hashcodes (inclusive) of the ranges
+        indices: int64[:]     Value to write for every range
+        out: int64[:]         Output buffer for the values of the containing ranges
+    '''
+    cdef Py_ssize_t i, lo, hi, mid, n = hashcodes.shape[0], m = starts.shape[0]
+    cdef ghh_uint hashcode
+
+    if out.shape[0] != n:
+        raise ValueError('`hashcodes` and `out` must have the same length')
+    if lasts.shape[0] != m or indices.shape[0] != m:
+        raise ValueError('`starts`, `lasts` and `indices` must have the same length')
+
+    for i in range(n):
+        if out[i] >= 0:
+            continue
+
+        hashcode = hashcodes[i]
+        lo = 0
+        hi = m
+        while lo < hi:  # first range starting after hashcode
+            mid = (lo + hi) // 2
+            if starts[mid] <= hashcode:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo > 0 and hashcode <= lasts[lo - 1]:
+            out[i] = indices[lo - 1]
+
+
 cdef void _rotate(ghh_uint n, ghh_uint* x, ghh_uint* y, ghh_uint rx, ghh_uint ry):
     if ry == 0:
         if rx == 1:
@@ -0,0 +1,109 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+
+from ._hilbert import _encode_ints, CYTHON_AVAILABLE
+from ._int2str import BitsPerChar, decode_int
+
+if CYTHON_AVAILABLE:
+    from ._hilbert_cython import lookup_ranges_cython, MAX_BITS
+
+
+def spatial_join(
+    lngs: Sequence[float],
+    lats: Sequence[float],
+    codes: Sequence[str],
+    bits_per_char: BitsPerChar = 6,
+) -> "array[int]":
+    """Assign every lng/lat position to the geohash cell in `codes` containing it
+
+    The `codes` may have different precisions. Every position is encoded only
+    once, using the precision of the longest code. Since a geohash of a coarser
+    precision covers a contiguous range of the finer hilbert curve, the containing
+    cell is found by a binary search over the sorted ranges of the `codes`. If
+    cells overlap, the finest (longest) code wins; for duplicate codes the first
+    occurrence wins.
+
+    Up to 64 bit, encoding and range search run in the cython bulk kernels.
+    Without cython (or for more than 64 bit), both loop over the positions in
+    pure python.
+
+    Parameters:
+        lngs: Sequence[float]  Longitudes; between -180.0 and 180.0; WGS 84
+        lats: Sequence[float]  Latitudes; between -90.0 and 90.0; WGS 84
+        codes: Sequence[str]   The geohash cells to join against.
+        bits_per_char: int     The number of bits per coding character.
+
+    Returns:
+        array[int]: for every position the index of the containing cell in `codes`,
+            or -1 if no cell contains the position.
+    """
+    assert bits_per_char in (2, 4, 6)
+    if len(lngs) != len(lats):
+        raise ValueError("`lngs` and `lats` must have the same length")
+
+    result = array("q", [-1]) * len(lngs)
+    if len(codes) == 0:
+        return result
+
+    precision = max(len(code) for code in codes)
+    bits = precision * bits_per_char
+
+    # one sorted table of range starts per precision, finest precision first
+    tables: dict[int, dict[int, int]] = {}
+    for idx, code in enumerate(codes):
+        shift = bits - len(code) * bits_per_char
+        start = decode_int(code, bits_per_char) << shift
+        tables.setdefault(len(code), {}).setdefault(start, idx)
+
+    lookups = []
+    for prec in sorted(tables, reverse=True):
+        table = tables[prec]
+        starts = sorted(table)
+        lookups.append(
+            (starts, [table[s] for s in starts], 1 << (bits - prec * bits_per_char))
+        )
+
+    hashcodes = _encode_ints(lngs, lats, bits >> 1)
+    if CYTHON_AVAILABLE and bits <= MAX_BITS:
+        for starts, indices, size in lookups:
+            lookup_ranges_cython(
+                hashcodes if isinstance(hashcodes, array) else array("Q", hashcodes),
+                array("Q", starts),
+                array("Q", [start + size - 1 for start in starts]),
+                array("q", indices),
+                result,
+            )
+        return result
+
+    for i, hashcode in enumerate(hashcodes):
+        for starts, indices, size in lookups:
+            pos = bisect_right(starts, hashcode) - 1
+            if pos >= 0 and hashcode < starts[pos] + size:
+                result[i] = indices[pos]
+                break
+
+    return result
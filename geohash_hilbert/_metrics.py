@@ -0,0 +1,143 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from collections.abc import MutableSequence, Sequence
+from math import asin, cos, radians, sin, sqrt
+
+from ._hilbert import _hash2xy_many, decode_exactly_many
+from ._int2str import BitsPerChar, decode_int
+
+# mean earth radius in meter (IUGG)
+EARTH_RADIUS = 6371008.8
+
+
+def haversine_distances(
+    codes_a: Sequence[str],
+    codes_b: Sequence[str],
+    bits_per_char: BitsPerChar = 6,
+    radius: float = EARTH_RADIUS,
+) -> "array[float]":
+    """Get the great-circle distances between the centers of pairs of geohashes
+
+    Parameters:
+        codes_a: Sequence[str]  The first geohash of every pair.
+        codes_b: Sequence[str]  The second geohash of every pair.
+        bits_per_char: int      The number of bits per coding character.
+        radius: float           Radius of the sphere (default: mean earth radius in m)
+
+    Returns:
+        array[float]: the distance of every pair (unit of `radius`, default m).
+    """
+    if len(codes_a) != len(codes_b):
+        raise ValueError("`codes_a` and `codes_b` must have the same length")
+
+    lngs_a, lats_a, _lng_errs, _lat_errs = decode_exactly_many(codes_a, bits_per_char)
+    lngs_b, lats_b, _lng_errs, _lat_errs = decode_exactly_many(codes_b, bits_per_char)
+
+    result = array("d")
+    for lng_a, lat_a, lng_b, lat_b in zip(lngs_a, lats_a, lngs_b, lats_b):
+        phi_a = radians(lat_a)
+        phi_b = radians(lat_b)
+        h = (
+            sin((phi_b - phi_a) / 2) ** 2
+            + cos(phi_a) * cos(phi_b) * sin(radians(lng_b - lng_a) / 2) ** 2
+        )
+        result.append(2 * radius * asin(min(1.0, sqrt(h))))
+    return result
+
+
+def cell_areas(
+    codes: Sequence[str],
+    bits_per_char: BitsPerChar = 6,
+    radius: float = EARTH_RADIUS,
+) -> "array[float]":
+    """Get the true area of the `rectangle` of many geohashes on the sphere
+
+    The area of a cell shrinks towards the poles with the cosine of the latitude.
+
+    Parameters:
+        codes: Sequence[str]  The geohashes.
+        bits_per_char: int    The number of bits per coding character.
+        radius: float         Radius of the sphere (default: mean earth radius in m)
+
+    Returns:
+        array[float]: the area of every cell (unit of `radius` squared, default m²).
+    """
+    result = array("d")
+    for _lng, lat, lng_err, lat_err in zip(*decode_exactly_many(codes, bits_per_char)):
+        result.append(
+            radius**2
+            * radians(2 * lng_err)
+            * abs(sin(radians(lat + lat_err)) - sin(radians(lat - lat_err)))
+        )
+    return result
+
+
+def grid_distances(
+    codes_a: Sequence[str],
+    codes_b: Sequence[str],
+    bits_per_char: BitsPerChar = 6,
+) -> Sequence[int]:
+    """Get the grid-step (Chebyshev) distances between pairs of geohashes
+
+    The distance is the number of steps (including diagonal steps) in the
+    dim x dim-grid of the hilbert curve, i.e. neighbours have distance 1. It
+    does not wrap around the globe at the east/west edge. The pairs of every
+    precision are converted to the grid in one pass of the bulk kernel.
+
+    Parameters:
+        codes_a: Sequence[str]  The first geohash of every pair.
+        codes_b: Sequence[str]  The second geohash of every pair.
+        bits_per_char: int      The number of bits per coding character.
+
+    Returns:
+        Sequence[int]: the distance of every pair; an `array('q')`, or a list if
+            a pair is finer than level 63 (distances may exceed 64 bit).
+    """
+    if len(codes_a) != len(codes_b):
+        raise ValueError("`codes_a` and `codes_b` must have the same length")
+
+    groups: dict[int, list[int]] = {}
+    for i, (code_a, code_b) in enumerate(zip(codes_a, codes_b)):
+        if len(code_a) != len(code_b):
+            raise ValueError("Both geohashes of a pair need the same precision")
+        groups.setdefault(len(code_a), []).append(i)
+
+    n = len(codes_a)
+    # distances are < dim, i.e. fit 64 bit signed ints up to level 63
+    max_level = (max(groups, default=0) * bits_per_char) >> 1
+    result: MutableSequence[int] = (
+        array("q", bytes(8 * n)) if max_level <= 63 else [0] * n
+    )
+    for length, indices in groups.items():
+        level = (length * bits_per_char) >> 1
+        xs_a, ys_a = _hash2xy_many(
+            [decode_int(codes_a[i], bits_per_char) for i in indices], level
+        )
+        xs_b, ys_b = _hash2xy_many(
+            [decode_int(codes_b[i], bits_per_char) for i in indices], level
+        )
+        for i, x_a, y_a, x_b, y_b in zip(indices, xs_a, ys_a, xs_b, ys_b):
+            result[i] = max(abs(x_a - x_b), abs(y_a - y_b))
+    return result
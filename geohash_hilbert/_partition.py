@@ -0,0 +1,188 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+import json
+
+from ._hilbert import _encode_ints
+from ._int2str import BitsPerChar, encode_int
+
+
+class Partitioner:
+    """Split the hilbert curve into contiguous ranges for distributing work
+
+    Partition `i` holds all geohashes `code` with `splits[i - 1] <= code < splits[i]`
+    (lexicographical order is hilbert order). As every partition is a contiguous
+    range of the hilbert curve, it stays spatially compact. Build it from a sample
+    with `from_points` or `from_codes` to get partitions with balanced counts.
+
+    Parameters:
+        splits: Sequence[str]  Sorted split points; `len(splits) + 1` partitions.
+        precision: int         The number of characters used for `partition_of_point`.
+        bits_per_char: int     The number of bits per coding character.
+    """
+
+    def __init__(
+        self,
+        splits: Sequence[str],
+        precision: int = 10,
+        bits_per_char: BitsPerChar = 6,
+    ) -> None:
+        assert precision > 0
+        assert bits_per_char in (2, 4, 6)
+        if any(a > b for a, b in zip(splits, splits[1:])):
+            raise ValueError("`splits` must be sorted")
+
+        self.splits = list(splits)
+        self.precision = precision
+        self.bits_per_char = bits_per_char
+        self._width = max(map(len, self.splits), default=0)
+
+    def __len__(self) -> int:
+        return len(self.splits) + 1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Partitioner):
+            return NotImplemented
+        return (self.splits, self.precision, self.bits_per_char) == (
+            other.splits,
+            other.precision,
+            other.bits_per_char,
+        )
+
+    @classmethod
+    def from_codes(
+        cls, codes: Iterable[str], n: int, bits_per_char: BitsPerChar = 6
+    ) -> "Partitioner":
+        """Build `n` partitions with balanced counts from a sample of geohashes
+
+        Parameters:
+            codes: Iterable[str]  Sample of geohashes (all of the same precision).
+            n: int                Number of partitions.
+            bits_per_char: int    The number of bits per coding character.
+
+        Returns:
+            Partitioner: with `n` partitions.
+        """
+        assert n > 0
+        sample = sorted(codes)
+        if not sample:
+            raise ValueError("Need at least one geohash to partition")
+
+        splits = [sample[i * len(sample) // n] for i in range(1, n)]
+        return cls(splits, max(1, len(sample[0])), bits_per_char)
+
+    @classmethod
+    def from_points(
+        cls,
+        lngs: Sequence[float],
+        lats: Sequence[float],
+        n: int,
+        precision: int = 10,
+        bits_per_char: BitsPerChar = 6,
+    ) -> "Partitioner":
+        """Build `n` partitions with balanced counts from a sample of lng/lat positions
+
+        Parameters:
+            lngs: Sequence[float]  Longitudes; between -180.0 and 180.0; WGS 84
+            lats: Sequence[float]  Latitudes; between -90.0 and 90.0; WGS 84
+            n: int                 Number of partitions.
+            precision: int         The number of characters of the split points.
+            bits_per_char: int     The number of bits per coding character.
+
+        Returns:
+            Partitioner: with `n` partitions.
+        """
+        assert precision > 0
+        assert bits_per_char in (2, 4, 6)
+        if len(lngs) != len(lats):
+            raise ValueError("`lngs` and `lats` must have the same length")
+
+        level = (precision * bits_per_char) >> 1
+        codes = (
+            encode_int(code, bits_per_char).rjust(precision, "0")
+            for code in _encode_ints(lngs, lats, level)
+        )
+        partitioner = cls.from_codes(codes, n, bits_per_char)
+        partitioner.precision = precision
+        return partitioner
+
+    def partition_of(self, code: str) -> int:
+        """Get the partition of a geohash
+
+        Geohashes coarser than the split points are assigned by their start on
+        the hilbert curve, i.e. they are padded with '0' to the length of the
+        split points.
+
+        Parameters:
+            code: str  The geohash.
+
+        Returns:
+            int: partition ∈ [0, len(self))
+        """
+        return bisect_right(self.splits, code.ljust(self._width, "0"))
+
+    def partition_of_point(self, lng: float, lat: float) -> int:
+        """Get the partition of a lng/lat position
+
+        Parameters:
+            lng: float  Longitude; between -180.0 and 180.0; WGS 84
+            lat: float  Latitude; between -90.0 and 90.0; WGS 84
+
+        Returns:
+            int: partition ∈ [0, len(self))
+        """
+        (code,) = _encode_ints(
+            (lng,), (lat,), (self.precision * self.bits_per_char) >> 1
+        )
+        return self.partition_of(
+            encode_int(code, self.bits_per_char).rjust(self.precision, "0")
+        )
+
+    def to_json(self) -> str:
+        """Serialise the partitioner, see `from_json`
+
+        Returns:
+            str: json document with the split points.
+        """
+        return json.dumps(
+            {
+                "splits": self.splits,
+                "precision": self.precision,
+                "bits_per_char": self.bits_per_char,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "Partitioner":
+        """Deserialise a partitioner, see `to_json`
+
+        Parameters:
+            data: str  json document created by `to_json`.
+
+        Returns:
+            Partitioner: with the serialised split points.
+        """
+        obj = json.loads(data)
+        return cls(obj["splits"], obj["precision"], obj["bits_per_char"])
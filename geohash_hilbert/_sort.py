@@ -0,0 +1,293 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+from heapq import merge
+from contextlib import contextmanager, ExitStack
+from itertools import count, islice, repeat
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from typing import Any, BinaryIO, Optional
+
+from ._hilbert import _encode_ints
+
+
+def hilbert_argsort(
+    lngs: Sequence[float], lats: Sequence[float], level: int = 30
+) -> "array[int]":
+    """Get the permutation sorting lng/lat positions along the hilbert curve
+
+    The positions are encoded straight to integer hashcodes on a hilbert curve
+    of level `level` (no string geohashes), which are then sorted. The sort is
+    stable, i.e. positions in the same cell keep their relative order.
+
+    Parameters:
+        lngs: Sequence[float]  Longitudes; between -180.0 and 180.0; WGS 84
+        lats: Sequence[float]  Latitudes; between -90.0 and 90.0; WGS 84
+        level: int             Level of the used hilbert curve
+
+    Returns:
+        array[int]: indices into `lngs` / `lats` in hilbert order.
+    """
+    assert level >= 0
+    if len(lngs) != len(lats):
+        raise ValueError("`lngs` and `lats` must have the same length")
+
+    hashcodes = _encode_ints(lngs, lats, level)
+    return array("q", sorted(range(len(hashcodes)), key=hashcodes.__getitem__))
+
+
+def hilbert_sort(
+    lngs: MutableSequence[float],
+    lats: MutableSequence[float],
+    *columns: MutableSequence[Any],
+    level: int = 30,
+) -> None:
+    """Sort lng/lat positions and their payload columns along the hilbert curve in-place
+
+    Every column is gathered into a temporary list of its length before it is
+    written back, i.e. the peak memory is about one more column. Use
+    `hilbert_sort_external` for inputs larger than the available memory.
+
+    Parameters:
+        lngs: MutableSequence[float]     Longitudes; between -180.0 and 180.0; WGS 84
+        lats: MutableSequence[float]     Latitudes; between -90.0 and 90.0; WGS 84
+        columns: MutableSequence[Any]    Payload columns of the same length.
+        level: int                       Level of the used hilbert curve
+    """
+    if any(len(column) != len(lngs) for column in columns):
+        raise ValueError("All `columns` must have the same length as `lngs`")
+
+    order = hilbert_argsort(lngs, lats, level)
+    for column in (lngs, lats, *columns):
+        values = [column[i] for i in order]
+        if isinstance(column, array):
+            column[:] = array(column.typecode, values)
+        else:
+            column[:] = values
+
+
+def hilbert_argsort_external(
+    lngs: Iterable[float],
+    lats: Iterable[float],
+    level: int = 30,
+    chunk_size: int = 1 << 20,
+    tmpdir: Optional[str] = None,
+) -> Iterator[int]:
+    """Get the permutation sorting lng/lat positions along the hilbert curve out-of-core
+
+    External memory version of `hilbert_argsort` for inputs larger than the
+    available memory: the positions are consumed in chunks of `chunk_size`,
+    every chunk is sorted and written as a run of (hashcode, index) pairs to a
+    temporary file in `tmpdir`, and the runs are merged lazily (in several
+    passes for many runs, such that only a bounded number of files is open).
+    Hence, only about `chunk_size` positions are kept in memory. The temporary
+    files are removed when the returned iterator is exhausted or closed.
+
+    Parameters:
+        lngs: Iterable[float]  Longitudes; between -180.0 and 180.0; WGS 84
+        lats: Iterable[float]  Latitudes; between -90.0 and 90.0; WGS 84
+        level: int             Level of the used hilbert curve; at most 32
+        chunk_size: int        Number of positions sorted in memory at once.
+        tmpdir: str            Directory for the temporary files.
+
+    Returns:
+        Iterator[int]: indices into `lngs` / `lats` in hilbert order.
+    """
+    for idx, _row in _merge_runs(lngs, lats, None, level, chunk_size, tmpdir):
+        yield idx
+
+
+def hilbert_sort_external(
+    lngs: Iterable[float],
+    lats: Iterable[float],
+    *columns: Iterable[Any],
+    level: int = 30,
+    chunk_size: int = 1 << 20,
+    tmpdir: Optional[str] = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Sort lng/lat positions and their payload columns along the hilbert curve out-of-core
+
+    External memory version of `hilbert_sort`: like `hilbert_argsort_external`,
+    but the rows (lng, lat, *payload) of every chunk are pickled next to its run
+    of (hashcode, index) pairs, such that the merge yields the sorted rows and
+    the input does not have to be read a second time. Only about `chunk_size`
+    rows are kept in memory; the temporary files are removed when the returned
+    iterator is exhausted or closed.
+
+    Parameters:
+        lngs: Iterable[float]     Longitudes; between -180.0 and 180.0; WGS 84
+        lats: Iterable[float]     Latitudes; between -90.0 and 90.0; WGS 84
+        columns: Iterable[Any]    Payload columns of the same length; picklable.
+        level: int                Level of the used hilbert curve; at most 32
+        chunk_size: int           Number of rows sorted in memory at once.
+        tmpdir: str               Directory for the temporary files.
+
+    Returns:
+        Iterator[tuple]: rows (lng, lat, *payload) in hilbert order.
+    """
+    for _idx, row in _merge_runs(lngs, lats, columns, level, chunk_size, tmpdir):
+        yield row
+
+
+# runs merged at once, i.e. at most 2 * _MAX_FAN_IN open files; more runs are
+# merged in several passes
+_MAX_FAN_IN = 64
+
+
+def _merge_runs(
+    lngs: Iterable[float],
+    lats: Iterable[float],
+    columns: Optional[Sequence[Iterable[Any]]],
+    level: int,
+    chunk_size: int,
+    tmpdir: Optional[str],
+) -> Iterator[tuple[int, Any]]:
+    """Write sorted runs of `chunk_size` positions and merge them lazily
+
+    Yields (index, row) in hilbert order, where the row (lng, lat, *payload) is
+    only stored and read back if `columns` is not None. At most `_MAX_FAN_IN`
+    runs are merged at once, each read in blocks of `chunk_size // runs`
+    entries, hence, about `chunk_size` entries are kept in memory.
+    """
+    assert 0 <= level <= 32  # hashcodes are stored as 64 bit unsigned ints
+    assert chunk_size > 0
+    with_rows = columns is not None
+
+    with TemporaryDirectory(dir=tmpdir) as directory:
+        names = (os.path.join(directory, f"run{n}") for n in count())
+        paths: list[str] = []
+        lit = iter(lngs)
+        lit_lats = iter(lats)
+        cits = [iter(column) for column in columns or ()]
+        offset = 0
+        while True:
+            chunk_lngs = list(islice(lit, chunk_size))
+            chunk_lats = list(islice(lit_lats, chunk_size))
+            if len(chunk_lngs) != len(chunk_lats):
+                raise ValueError("`lngs` and `lats` must have the same length")
+            chunk_columns = [list(islice(cit, chunk_size)) for cit in cits]
+            if any(len(column) != len(chunk_lngs) for column in chunk_columns):
+                raise ValueError("All `columns` must have the same length as `lngs`")
+            if not chunk_lngs:
+                break
+
+            hashcodes = _encode_ints(chunk_lngs, chunk_lats, level)
+            order = sorted(range(len(hashcodes)), key=hashcodes.__getitem__)
+            rows = (
+                list(zip(chunk_lngs, chunk_lats, *chunk_columns))
+                if with_rows
+                else [None] * len(order)
+            )
+            path = next(names)
+            _write_run(
+                path,
+                ((hashcodes[i], offset + i, rows[i]) for i in order),
+                with_rows,
+                chunk_size,
+            )
+            paths.append(path)
+            offset += len(chunk_lngs)
+
+        while len(paths) > _MAX_FAN_IN:
+            merged = []
+            for start in range(0, len(paths), _MAX_FAN_IN):
+                group = paths[start : start + _MAX_FAN_IN]
+                block_size = max(1, chunk_size // len(group))
+                path = next(names)
+                with _open_runs(group, with_rows, block_size) as runs:
+                    # (hashcode, index) is unique, hence, rows are never compared
+                    _write_run(path, merge(*runs), with_rows, block_size)
+                for done in group:
+                    os.remove(done)
+                    if with_rows:
+                        os.remove(done + ".rows")
+                merged.append(path)
+            paths = merged
+
+        block_size = max(1, chunk_size // max(1, len(paths)))
+        with _open_runs(paths, with_rows, block_size) as runs:
+            for _hashcode, idx, row in merge(*runs):
+                yield idx, row
+
+
+def _write_run(
+    path: str, entries: Iterable[tuple[int, int, Any]], with_rows: bool, block_size: int
+) -> None:
+    """Write a sorted run of (hashcode, index, row) entries
+
+    The (hashcode, index) pairs are stored as 64 bit unsigned ints in `path`,
+    the rows are pickled one by one into `path + '.rows'` (if `with_rows`).
+    """
+    with ExitStack() as stack:
+        out = stack.enter_context(open(path, "wb"))
+        out_rows = (
+            stack.enter_context(open(path + ".rows", "wb")) if with_rows else None
+        )
+        block = array("Q")
+        for hashcode, idx, row in entries:
+            block.append(hashcode)
+            block.append(idx)
+            if out_rows is not None:
+                pickle.dump(row, out_rows)
+            if len(block) >= 2 * block_size:
+                block.tofile(out)
+                block = array("Q")
+        block.tofile(out)
+
+
+@contextmanager
+def _open_runs(
+    paths: Sequence[str], with_rows: bool, block_size: int
+) -> Iterator[list[Iterator[tuple[int, int, Any]]]]:
+    """Open the runs at `paths` for block-wise reading; closed on exit"""
+    with ExitStack() as stack:
+        runs = []
+        for path in paths:
+            fp = stack.enter_context(open(path, "rb"))
+            fp_rows = (
+                stack.enter_context(open(path + ".rows", "rb")) if with_rows else None
+            )
+            runs.append(_read_run(fp, fp_rows, block_size))
+        yield runs
+
+
+def _read_run(
+    fp: BinaryIO, fp_rows: Optional[BinaryIO], block_size: int
+) -> Iterator[tuple[int, int, Any]]:
+    """Read a sorted run of (hashcode, index) pairs and their rows block-wise"""
+    while True:
+        block = array("Q")
+        try:
+            block.fromfile(fp, 2 * block_size)
+        except EOFError:
+            pass  # last (partial) block is still read into `block`
+        if not block:
+            return
+        if fp_rows is None:
+            yield from zip(block[::2], block[1::2], repeat(None))
+        else:
+            rows = [pickle.load(fp_rows) for _i in range(len(block) >> 1)]
+            yield from zip(block[::2], block[1::2], rows)
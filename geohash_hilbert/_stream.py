@@ -0,0 +1,169 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""Streaming utilities over hilbert ordered geohashes.
+
+The characters of all geohash representations keep the order of their integer
+values (see `_int2str._BASE64`), and a geohash of a coarser precision covers a
+contiguous range of the finer hilbert curve starting at its own position.
+Hence, sorting geohashes lexicographically sorts them along the hilbert curve,
+and a cell always sorts right before the cells it contains. All functions here
+expect their inputs in this (lexicographical) order, consume them lazily and
+keep only a bounded number of geohashes in memory.
+"""
+
+from collections.abc import Iterable, Iterator
+from heapq import merge
+
+from ._int2str import _BASE64, BitsPerChar
+
+
+_ALPHABETS = {
+    2: "0123",
+    4: "0123456789abcdef",
+    6: _BASE64,
+}
+
+
+def merge_codes(*iterables: Iterable[str]) -> Iterator[str]:
+    """K-way merge of sorted geohash streams into one sorted stream
+
+    Parameters:
+        iterables: Iterable[str]  Sorted streams of geohashes.
+
+    Returns:
+        Iterator[str]: all geohashes of all streams in hilbert order.
+    """
+    return merge(*iterables)
+
+
+def unique_codes(codes: Iterable[str]) -> Iterator[str]:
+    """Drop duplicates from a sorted geohash stream
+
+    Parameters:
+        codes: Iterable[str]  Sorted stream of geohashes.
+
+    Returns:
+        Iterator[str]: the sorted geohashes without duplicates.
+    """
+    last = None
+    for code in codes:
+        if code != last:
+            yield code
+            last = code
+
+
+def union_codes(*iterables: Iterable[str]) -> Iterator[str]:
+    """Union of the areas covered by sorted geohash streams
+
+    Geohashes covered by a coarser geohash of any stream are dropped, i.e. the
+    result is a sorted stream of disjoint cells.
+
+    Parameters:
+        iterables: Iterable[str]  Sorted streams of geohashes.
+
+    Returns:
+        Iterator[str]: disjoint geohashes covering the union in hilbert order.
+    """
+    last = None
+    for code in merge(*iterables):
+        if last is None or not code.startswith(last):
+            yield code
+            last = code
+
+
+def intersect_codes(left: Iterable[str], right: Iterable[str]) -> Iterator[str]:
+    """Intersection of the areas covered by two sorted geohash streams
+
+    Parameters:
+        left: Iterable[str]   Sorted stream of geohashes.
+        right: Iterable[str]  Sorted stream of geohashes.
+
+    Returns:
+        Iterator[str]: disjoint geohashes covering the intersection in hilbert order.
+    """
+    lit = union_codes(left)
+    rit = union_codes(right)
+
+    lcode = next(lit, None)
+    rcode = next(rit, None)
+    while lcode is not None and rcode is not None:
+        if rcode.startswith(lcode):  # right cell within left cell
+            yield rcode
+            rcode = next(rit, None)
+        elif lcode.startswith(rcode):  # left cell within right cell
+            yield lcode
+            lcode = next(lit, None)
+        elif lcode < rcode:
+            lcode = next(lit, None)
+        else:
+            rcode = next(rit, None)
+
+
+def compact_codes(
+    codes: Iterable[str], bits_per_char: BitsPerChar = 6
+) -> Iterator[str]:
+    """Compact a sorted geohash stream to its minimal mixed precision form
+
+    Covered geohashes are dropped (see `union_codes`) and complete sets of
+    siblings (all `2**bits_per_char` children of a cell) are collapsed
+    into their parent, recursively. The covered area does not change. At most
+    `precision * 2**bits_per_char` geohashes are buffered.
+
+    Parameters:
+        codes: Iterable[str]  Sorted stream of geohashes.
+        bits_per_char: int    The number of bits per coding character.
+
+    Returns:
+        Iterator[str]: minimal set of disjoint geohashes in hilbert order.
+    """
+    assert bits_per_char in (2, 4, 6)
+    alphabet = _ALPHABETS[bits_per_char]
+    siblings = len(alphabet)
+
+    # every cell on the stack has a parent containing the top of the stack,
+    # i.e. it holds at most `siblings - 1` cells per precision
+    stack: list[str] = []
+    for code in union_codes(codes):
+        if stack and not code.startswith(stack[-1][:-1]):
+            # the parent of the top closed incomplete, hence no cell on the stack
+            # can be collapsed anymore (all their parents contain this parent)
+            yield from stack
+            stack.clear()
+
+        stack.append(code)
+        while (
+            len(stack) >= siblings
+            and stack[-1]
+            and stack[-1][-1] == alphabet[-1]
+            and all(
+                len(stack[-i]) == len(code) and stack[-i][:-1] == code[:-1]
+                for i in range(2, siblings + 1)
+            )
+        ):
+            for _i in range(siblings):
+                stack.pop()
+            code = code[:-1]
+            stack.append(code)
+
+    yield from stack
@@ -0,0 +1,176 @@
+# The MIT License
+#
+# Copyright (c) 2017 - 2024 Tammo Ippen, tammo.ippen@posteo.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from array import array
+from collections.abc import Hashable, MutableSequence, Sequence
+from typing import Optional
+
+from ._encoder import Backend, Encoder
+from ._grid import Grid
+from ._int2str import BitsPerChar
+
+
+# (entity, previous geohash or None for new entities, current geohash)
+CellChange = tuple[Hashable, Optional[str], str]
+
+
+class Tracker:
+    """Track the geohash cells of moving entities
+
+    For every entity, the (x, y) cell of its last position in the dim x dim-grid
+    and its hashcode are cached in `array` storage. An update only checks,
+    whether the new position is still in this cell (which is exactly consistent
+    with `encode`), and runs the hilbert transform only when the entity changed
+    its cell. Geohash strings are only built for the returned cell changes.
+
+    Parameters:
+        precision: int      The number of characters in a geohash
+        bits_per_char: int  The number of bits per coding character
+        backend: str        'cython' or 'python' kernel (see `Encoder`)
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
+    """
+
+    def __init__(
+        self,
+        precision: int = 10,
+        bits_per_char: BitsPerChar = 6,
+        backend: Optional[Backend] = None,
+        grid: Optional[Grid] = None,
+    ) -> None:
+        self.encoder = Encoder(precision, bits_per_char, backend, grid)
+
+        self._slots: dict[Hashable, int] = {}  # entity -> slot
+        self._entities: list[Hashable] = []  # slot -> entity
+        # hashcodes fit 64 bit up to level 32, grid coordinates up to level 64
+        self._hashcodes: MutableSequence[int] = (
+            array("Q") if self.encoder.level <= 32 else []
+        )
+        self._xs: MutableSequence[int] = array("Q") if self.encoder.level <= 64 else []
+        self._ys: MutableSequence[int] = array("Q") if self.encoder.level <= 64 else []
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity: Hashable) -> bool:
+        return entity in self._slots
+
+    def cell(self, entity: Hashable) -> str:
+        """Get the current geohash of an entity
+
+        Parameters:
+            entity: Hashable  The tracked entity.
+
+        Returns:
+            str: geohash of the last position of `entity`
+        """
+        return self.encoder._hash2code(self._hashcodes[self._slots[entity]])
+
+    def update(self, entity: Hashable, lng: float, lat: float) -> Optional[CellChange]:
+        """Update the position of an entity
+
+        Parameters:
+            entity: Hashable  The tracked entity.
+            lng: float        Longitude; between -180.0 and 180.0; WGS 84
+            lat: float        Latitude; between -90.0 and 90.0; WGS 84
+
+        Returns:
+            CellChange: (entity, previous geohash, current geohash) if the entity
+                changed its cell (previous geohash is None for new entities),
+                otherwise None.
+        """
+        encoder = self.encoder
+        x, y = encoder._coord2xy(lng, lat)
+
+        slot = self._slots.get(entity)
+        if slot is None:
+            hashcode = encoder._xy2hash(x, y, encoder._dim)
+            self._slots[entity] = len(self._entities)
+            self._entities.append(entity)
+            self._hashcodes.append(hashcode)
+            self._xs.append(x)
+            self._ys.append(y)
+            return entity, None, encoder._hash2code(hashcode)
+
+        if x == self._xs[slot] and y == self._ys[slot]:
+            return None
+
+        previous = self._hashcodes[slot]
+        hashcode = self._hashcodes[slot] = encoder._xy2hash(x, y, encoder._dim)
+        self._xs[slot] = x
+        self._ys[slot] = y
+        return entity, encoder._hash2code(previous), encoder._hash2code(hashcode)
+
+    def update_many(
+        self,
+        entities: Sequence[Hashable],
+        lngs: Sequence[float],
+        lats: Sequence[float],
+    ) -> list[CellChange]:
+        """Update the positions of many entities
+
+        Parameters:
+            entities: Sequence[Hashable]  The tracked entities.
+            lngs: Sequence[float]         Longitudes; between -180.0 and 180.0; WGS 84
+            lats: Sequence[float]         Latitudes; between -90.0 and 90.0; WGS 84
+
+        Returns:
+            List[CellChange]: the cell changes in the order of the updates.
+        """
+        if not len(entities) == len(lngs) == len(lats):
+            raise ValueError("`entities`, `lngs` and `lats` must have the same length")
+
+        update = self.update
+        events = []
+        for entity, lng, lat in zip(entities, lngs, lats):
+            event = update(entity, lng, lat)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def remove(self, entity: Hashable) -> str:
+        """Stop tracking an entity
+
+        Parameters:
+            entity: Hashable  The tracked entity.
+
+        Returns:
+            str: the last geohash of `entity`
+        """
+        slot = self._slots.pop(entity)
+        code = self.encoder._hash2code(self._hashcodes[slot])
+
+        # move the last slot into the free slot
+        last = len(self._entities) - 1
+        if slot != last:
+            moved = self._entities[last]
+            self._slots[moved] = slot
+            self._entities[slot] = moved
+            self._hashcodes[slot] = self._hashcodes[last]
+            self._xs[slot] = self._xs[last]
+            self._ys[slot] = self._ys[last]
+
+        self._entities.pop()
+        self._hashcodes.pop()
+        self._xs.pop()
+        self._ys.pop()
+        return code
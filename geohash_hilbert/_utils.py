@@ -20,9 +20,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any, Literal
+from array import array
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any, Literal, Optional, TextIO
 
-from ._hilbert import decode, decode_exactly, encode
+from ._grid import Grid
+from ._hilbert import (
+    _code2xy,
+    _xy2code,
+    decode,
+    decode_exactly,
+    decode_exactly_many,
+    encode,
+)
 from ._int2str import BitsPerChar, encode_int
 
 
@@ -38,17 +49,21 @@ Directions = Literal[
 ]
 
 
-def neighbours(code: str, bits_per_char: BitsPerChar = 6) -> dict[Directions, str]:
+def neighbours(
+    code: str, bits_per_char: BitsPerChar = 6, grid: Optional[Grid] = None
+) -> dict[Directions, str]:
     """Get the neighbouring geohashes for `code`.
 
     Look for the north, north-east, east, south-east, south, south-west, west,
     north-west neighbours. If you are at the east/west edge of the grid
     (lng ∈ (-180, 180)), then it wraps around the globe and gets the corresponding
-    neighbor.
+    neighbor. With a regional `grid`, neighbours outside of the grid are not
+    present (it only wraps around, if the grid spans all longitudes).
 
     Parameters:
         code: str           The geohash at the center.
         bits_per_char: int  The number of bits per coding character.
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
 
     Returns:
         dict: geohashes in the neighborhood of `code`. Possible keys are 'north',
@@ -58,6 +73,9 @@ def neighbours(code: str, bits_per_char: BitsPerChar = 6) -> dict[Directions, st
             the input code covers the south pole then keys 'south', 'south-west',
             and 'south-east' are not present.
     """
+    if grid is not None:
+        return _grid_neighbours(code, bits_per_char, grid)
+
     lng, lat, lng_err, lat_err = decode_exactly(code, bits_per_char)
     precision = len(code)
 
@@ -99,7 +117,37 @@ def neighbours(code: str, bits_per_char: BitsPerChar = 6) -> dict[Directions, st
     return neighbours_dict
 
 
-def rectangle(code: str, bits_per_char: BitsPerChar = 6) -> dict[str, Any]:
+_DIRECTIONS: tuple[tuple[Directions, int, int], ...] = (
+    ("north", 0, 1),
+    ("north-east", 1, 1),
+    ("east", 1, 0),
+    ("south-east", 1, -1),
+    ("south", 0, -1),
+    ("south-west", -1, -1),
+    ("west", -1, 0),
+    ("north-west", -1, 1),
+)
+
+
+def _grid_neighbours(
+    code: str, bits_per_char: BitsPerChar, grid: Grid
+) -> dict[Directions, str]:
+    """Get the neighbouring geohashes for `code` by stepping in the dim x dim-grid"""
+    x, y, dim = _code2xy(code, bits_per_char)
+
+    neighbours_dict: dict[Directions, str] = {}
+    for direction, dx, dy in _DIRECTIONS:
+        nx, ny = x + dx, y + dy
+        if grid.wraps:
+            nx %= dim
+        if 0 <= nx < dim and 0 <= ny < dim:
+            neighbours_dict[direction] = _xy2code(nx, ny, dim, bits_per_char)
+    return neighbours_dict
+
+
+def rectangle(
+    code: str, bits_per_char: BitsPerChar = 6, grid: Optional[Grid] = None
+) -> dict[str, Any]:
     """Builds a (geojson) rectangle from `code`
 
     The center of the rectangle decodes as the lng/lat for code and
@@ -109,11 +157,12 @@ def rectangle(code: str, bits_per_char: BitsPerChar = 6) -> dict[str, Any]:
     Parameters:
         code: str           The geohash for which the rectangle should be build.
         bits_per_char: int  The number of bits per coding character.
+        grid: Grid          The domain mapped onto the hilbert curve (default: globe)
 
     Returns:
         dict: geojson `Feature` containing the rectangle as a `Polygon`.
     """
-    lng, lat, lng_err, lat_err = decode_exactly(code, bits_per_char)
+    lng, lat, lng_err, lat_err = decode_exactly(code, bits_per_char, grid)
 
     return {
         "type": "Feature",
@@ -146,6 +195,94 @@ def rectangle(code: str, bits_per_char: BitsPerChar = 6) -> dict[str, Any]:
     }
 
 
+def bboxes(codes: Iterable[str], bits_per_char: BitsPerChar = 6) -> "array[float]":
+    """Get the `rectangle` bbox of many geohashes
+
+    All bboxes are computed from one `decode_exactly_many` pass, without building
+    a geojson `Feature` per code.
+
+    Parameters:
+        codes: Iterable[str]  The geohashes for which the bboxes should be build.
+        bits_per_char: int    The number of bits per coding character.
+
+    Returns:
+        array[float]: the bboxes (min lng, min lat, max lng, max lat) flattened,
+            i.e. `result[4 * i: 4 * i + 4]` is the bbox of the i-th code.
+    """
+    result = array("d")
+    for lng, lat, lng_err, lat_err in zip(*decode_exactly_many(codes, bits_per_char)):
+        result.extend((lng - lng_err, lat - lat_err, lng + lng_err, lat + lat_err))
+    return result
+
+
+_RECTANGLE_FEATURE = (
+    '{{"type": "Feature", "properties": {{"code": "{code}", "lng": {lng!r}, '
+    '"lat": {lat!r}, "lng_err": {lng_err!r}, "lat_err": {lat_err!r}, '
+    '"bits_per_char": {bits_per_char}}}, '
+    '"bbox": [{w!r}, {s!r}, {e!r}, {n!r}], '
+    '"geometry": {{"type": "Polygon", "coordinates": [[[{w!r}, {s!r}], '
+    "[{e!r}, {s!r}], [{e!r}, {n!r}], [{w!r}, {n!r}], [{w!r}, {s!r}]]]}}}}"
+)
+
+
+def write_rectangles(
+    codes: Iterable[str],
+    fp: TextIO,
+    bits_per_char: BitsPerChar = 6,
+    chunk_size: int = 4096,
+) -> int:
+    """Write the (geojson) rectangles of many geohashes as `FeatureCollection` to `fp`
+
+    Streaming version of `rectangle`: every feature equals `rectangle(code)`
+    (serialized with `json.dump`), but the codes are decoded in chunks of
+    `chunk_size` with `decode_exactly_many` and written straight to `fp`
+    without building a dict per feature. Use it e.g. with the values of
+    `neighbours(code)` to emit the neighbourhood of a cell.
+
+    Parameters:
+        codes: Iterable[str]  The geohashes for which the rectangles should be build.
+        fp: TextIO            File-like object to write the geojson to.
+        bits_per_char: int    The number of bits per coding character.
+        chunk_size: int       Number of codes decoded at once.
+
+    Returns:
+        int: number of written features.
+    """
+    assert chunk_size > 0
+
+    it = iter(codes)
+    count = 0
+    fp.write('{"type": "FeatureCollection", "features": [')
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            break
+
+        if count > 0:
+            fp.write(", ")
+        decoded = decode_exactly_many(chunk, bits_per_char)
+        fp.write(
+            ", ".join(
+                _RECTANGLE_FEATURE.format(
+                    code=code,
+                    lng=lng,
+                    lat=lat,
+                    lng_err=lng_err,
+                    lat_err=lat_err,
+                    bits_per_char=bits_per_char,
+                    w=lng - lng_err,
+                    s=lat - lat_err,
+                    e=lng + lng_err,
+                    n=lat + lat_err,
+                )
+                for code, lng, lat, lng_err, lat_err in zip(chunk, *decoded)
+            )
+        )
+        count += len(chunk)
+    fp.write("]}")
+    return count
+
+
 def hilbert_curve(precision: int, bits_per_char: BitsPerChar = 6) -> dict[str, Any]:
     """Build the (geojson) `LineString` of the used hilbert-curve
 
@@ -0,0 +1,79 @@
+from collections import Counter
+import pickle
+from random import random
+
+import pytest
+
+from geohash_hilbert import CellAggregator, encode, rectangle
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", range(1, 5))
+def test_aggregate(bpc, prec):
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+    weights = [random() for _i in range(1000)]
+
+    agg = CellAggregator(prec, bpc)
+    agg.add(lngs[:500], lats[:500], weights[:500])
+    agg.add(lngs[500:], lats[500:], weights[500:])
+
+    expected_counts = Counter()
+    expected_sums = Counter()
+    for lng, lat, weight in zip(lngs, lats, weights):
+        code = encode(lng, lat, prec, bpc)
+        expected_counts[code] += 1
+        expected_sums[code] += weight
+
+    codes, counts, sums, bboxes = agg.export()
+    assert len(expected_counts) == len(agg) == len(codes)
+    assert sorted(codes) == codes  # hilbert order
+    assert 4 * len(codes) == len(bboxes)
+
+    for i, code in enumerate(codes):
+        assert expected_counts[code] == counts[i]
+        assert expected_sums[code] == pytest.approx(sums[i])
+        assert rectangle(code, bpc)["bbox"] == pytest.approx(
+            tuple(bboxes[4 * i : 4 * i + 4])
+        )
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_merge(bpc):
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+
+    full = CellAggregator(3, bpc)
+    full.add(lngs, lats)
+
+    left = CellAggregator(3, bpc)
+    left.add(lngs[:300], lats[:300])
+    right = CellAggregator(3, bpc)
+    right.add(lngs[300:], lats[300:])
+    left.merge(pickle.loads(pickle.dumps(right)))
+
+    assert full.export() == left.export()
+    _codes, counts, sums, _bboxes = full.export()
+    assert 1000 == sum(counts)
+    assert list(counts) == list(sums)  # no weights
+
+    with pytest.raises(ValueError):
+        left.merge(CellAggregator(4, bpc))
+
+
+def test_invalid():
+    agg = CellAggregator(3)
+    with pytest.raises(ValueError):
+        agg.add([0, 1], [0])
+    with pytest.raises(ValueError):
+        agg.add([0], [0], [1, 2])
+
+    assert ([], [], [], []) == tuple(list(v) for v in agg.export())
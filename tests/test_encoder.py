@@ -0,0 +1,105 @@
+from random import random
+
+import pytest
+
+from geohash_hilbert import (
+    decode,
+    decode_exactly,
+    decode_exactly_many,
+    encode,
+    Encoder,
+    Grid,
+    neighbours,
+)
+from geohash_hilbert._hilbert import CYTHON_AVAILABLE
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("backend", (None, "python"))
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", range(1, 15))
+def test_encoder(backend, bpc, prec):
+    encoder = Encoder(prec, bpc, backend)
+    assert encoder.level == (prec * bpc) >> 1
+
+    lngs = [rand_lng() for _i in range(100)]
+    lats = [rand_lat() for _i in range(100)]
+    codes = encoder.encode_many(lngs, lats)
+
+    for lng, lat, code in zip(lngs, lats, codes):
+        assert encode(lng, lat, prec, bpc) == code == encoder.encode(lng, lat)
+        assert decode_exactly(code, bpc) == encoder.decode_exactly(code)
+        assert decode(code, bpc) == encoder.decode(code)
+        if prec > 1:
+            assert neighbours(code, bpc) == encoder.neighbours(code)
+
+    assert decode_exactly_many(codes, bpc) == encoder.decode_exactly_many(codes)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_encoder_grid(bpc):
+    grid = Grid(5.8, 47.2, 15.1, 55.1)
+    encoder = Encoder(6, bpc, grid=grid)
+
+    for _i in range(100):
+        lng = grid.lng_min + random() * (grid.lng_max - grid.lng_min)
+        lat = grid.lat_min + random() * (grid.lat_max - grid.lat_min)
+        code = encoder.encode(lng, lat)
+        assert encode(lng, lat, 6, bpc, grid=grid) == code
+        assert decode_exactly(code, bpc, grid=grid) == encoder.decode_exactly(code)
+        assert neighbours(code, bpc, grid=grid) == encoder.neighbours(code)
+
+
+@pytest.mark.skipif(not CYTHON_AVAILABLE, reason="needs cython kernels")
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_encoder_many_backends(bpc):
+    cython = Encoder(60 // bpc, bpc, "cython")
+    python = Encoder(60 // bpc, bpc, "python")
+    lngs = [-180, 180, 0] + [rand_lng() for _i in range(100)]
+    lats = [-90, 90, 0] + [rand_lat() for _i in range(100)]
+
+    codes = cython.encode_many(lngs, lats)
+    assert python.encode_many(lngs, lats) == codes
+    assert python.decode_exactly_many(codes) == cython.decode_exactly_many(codes)
+    assert ((),) * 4 == tuple(map(tuple, cython.decode_exactly_many([])))
+    with pytest.raises(AssertionError):
+        cython.decode_exactly_many(["Z7fe"])
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        Encoder(11, 6, "cython")  # more than 64 bit
+    with pytest.raises(ValueError):
+        Encoder(10, 6, "rust")
+    with pytest.raises(AssertionError):
+        Encoder(10).decode("Z7fe")
+    with pytest.raises(ValueError):
+        Encoder(10).encode_many([1, 2], [1])
+
+    assert ("cython" if CYTHON_AVAILABLE else "python") == Encoder(10).backend
+    assert "python" == Encoder(11).backend
+    assert "Encoder(precision=4, bits_per_char=6, backend='python', grid=None)" == repr(
+        Encoder(4, backend="python")
+    )
+
+    with pytest.raises(AttributeError):
+        Encoder().foo = 1
+
+
+def test_bench_encoder_encode(benchmark):
+    encoder = Encoder(10, 6)
+    lng, lat = rand_lng(), rand_lat()
+    benchmark(encoder.encode, lng, lat)
+
+
+def test_bench_encoder_decode(benchmark):
+    encoder = Encoder(10, 6)
+    code = encoder.encode(rand_lng(), rand_lat())
+    benchmark(encoder.decode_exactly, code)
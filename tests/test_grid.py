@@ -0,0 +1,129 @@
+from random import random, uniform
+
+import pytest
+
+from geohash_hilbert import Grid, decode, decode_exactly, encode, neighbours, rectangle
+from geohash_hilbert._grid import MERCATOR_MAX_LAT
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+GERMANY = Grid(5.8, 47.2, 15.1, 55.1)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", range(1, 7))
+def test_world_grid(bpc, prec):
+    world = Grid()
+    for _i in range(100):
+        lng, lat = rand_lng(), rand_lat()
+        code = encode(lng, lat, prec, bpc)
+        assert code == encode(lng, lat, prec, bpc, grid=world)
+        assert decode_exactly(code, bpc) == decode_exactly(code, bpc, grid=world)
+        assert neighbours(code, bpc) == neighbours(code, bpc, grid=world)
+        assert rectangle(code, bpc) == rectangle(code, bpc, grid=world)
+
+    assert (0, 0, 180, 90) == decode_exactly("", bpc, grid=world)
+
+
+@pytest.mark.parametrize(
+    "grid", (GERMANY, Grid(mercator=True), Grid(-10, 35, 30, 70, True))
+)
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", range(1, 15))
+def test_encode_decode(grid, bpc, prec):
+    for _i in range(100):
+        lng = uniform(grid.lng_min, grid.lng_max)
+        lat = uniform(grid.lat_min, grid.lat_max)
+        code = encode(lng, lat, prec, bpc, grid=grid)
+        lng_code, lat_code, lng_err, lat_err = decode_exactly(code, bpc, grid=grid)
+
+        assert lng == pytest.approx(lng_code, abs=lng_err)
+        # float error of the mercator projection at the finest cells
+        assert lat == pytest.approx(lat_code, abs=lat_err + 1e-12)
+        assert (lng_code, lat_code) == decode(code, bpc, grid=grid)
+
+        # the center of the cell encodes as the cell
+        assert code == encode(lng_code, lat_code, prec, bpc, grid=grid)
+
+
+def test_regional_resolution():
+    lng, lat = 6.957036, 50.941291
+    _lng, _lat, lng_err, lat_err = decode_exactly(encode(lng, lat), grid=None)
+    code = encode(lng, lat, grid=GERMANY)
+    _lng, _lat, g_lng_err, g_lat_err = decode_exactly(code, grid=GERMANY)
+
+    assert g_lng_err < lng_err / 30
+    assert g_lat_err < lat_err / 20
+
+    with pytest.raises(AssertionError):
+        encode(-73.985656, 40.748433, grid=GERMANY)
+
+
+def test_mercator():
+    grid = Grid(mercator=True)
+    assert grid.lat_max == MERCATOR_MAX_LAT
+    # cells span less latitude towards the poles
+    code = encode(0, 0, 3, grid=grid)
+    _lng, _lat, _lng_err, equator_err = decode_exactly(code, grid=grid)
+    code = encode(0, 80, 3, grid=grid)
+    _lng, _lat, _lng_err, polar_err = decode_exactly(code, grid=grid)
+    assert equator_err > 4 * polar_err
+
+    rect = rectangle(encode(0, 80, 3, grid=grid), grid=grid)
+    _west, south, _east, north = rect["bbox"]
+    assert south <= 80 <= north
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", range(2, 7))
+def test_neighbours(bpc, prec):
+    for _i in range(100):
+        lng = uniform(GERMANY.lng_min, GERMANY.lng_max)
+        lat = uniform(GERMANY.lat_min, GERMANY.lat_max)
+        code = encode(lng, lat, prec, bpc, grid=GERMANY)
+        lng, lat, lng_err, lat_err = decode_exactly(code, bpc, grid=GERMANY)
+
+        expected = {}
+        for direction, dlng, dlat in (
+            ("north", 0, 1),
+            ("north-east", 1, 1),
+            ("east", 1, 0),
+            ("south-east", 1, -1),
+            ("south", 0, -1),
+            ("south-west", -1, -1),
+            ("west", -1, 0),
+            ("north-west", -1, 1),
+        ):
+            n_lng = lng + 2 * dlng * lng_err
+            n_lat = lat + 2 * dlat * lat_err
+            if (
+                GERMANY.lng_min < n_lng < GERMANY.lng_max
+                and GERMANY.lat_min < n_lat < GERMANY.lat_max
+            ):
+                expected[direction] = encode(n_lng, n_lat, prec, bpc, grid=GERMANY)
+
+        assert expected == neighbours(code, bpc, grid=GERMANY)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        Grid(10, 0, 5, 10)
+    with pytest.raises(ValueError):
+        Grid(-200, 0, 5, 10)
+    with pytest.raises(ValueError):
+        Grid(0, 10, 5, 0)
+    with pytest.raises(ValueError):
+        Grid(0, 0, 5, 89, mercator=True)
+
+    assert Grid(0, 0, 5, 10) == Grid(0.0, 0.0, 5.0, 10.0)
+    assert Grid(0, 0, 5, 10) != Grid(0, 0, 5, 10, mercator=True)
+    assert "Grid(lng_min=0, lat_min=0, lng_max=5, lat_max=10, mercator=False)" == repr(
+        Grid(0, 0, 5, 10)
+    )
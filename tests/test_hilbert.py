@@ -1,3 +1,4 @@
+from array import array
 from random import random
 
 import pytest
@@ -125,3 +126,122 @@ def test_coord2int2coord():
             # hence add error and then we have +- error
             assert lng == pytest.approx(lng_x + lng_err, abs=lng_err)
             assert lat == pytest.approx(lat_y + lat_err, abs=lat_err)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_decode_exactly_many(bpc):
+    codes = [""] + [
+        hilbert.encode(rand_lng(), rand_lat(), precision=prec, bits_per_char=bpc)
+        for prec in range(1, 15)
+        for _i in range(20)
+    ]
+
+    decoded = hilbert.decode_exactly_many(codes, bits_per_char=bpc)
+    assert 4 == len(decoded)
+    assert [hilbert.decode_exactly(code, bits_per_char=bpc) for code in codes] == list(
+        zip(*decoded)
+    )
+
+    codes = codes[-20:]  # all of the same length
+    decoded = hilbert.decode_exactly_many(codes, bits_per_char=bpc)
+    assert [hilbert.decode_exactly(code, bits_per_char=bpc) for code in codes] == list(
+        zip(*decoded)
+    )
+    assert ((),) * 4 == tuple(map(tuple, hilbert.decode_exactly_many([], bpc)))
+
+
+@pytest.mark.skipif(not hilbert.CYTHON_AVAILABLE, reason="needs cython kernels")
+@pytest.mark.parametrize("level", (1, 5, 16, 30, 32))
+def test_cython_bulk_kernels(level):
+    from geohash_hilbert import _hilbert_cython as cy
+
+    dim = 1 << level
+    n = 1000
+    lngs = array("d", [rand_lng() for _i in range(n)] + [-180, 180])
+    lats = array("d", [rand_lat() for _i in range(n)] + [-90, 90])
+    n += 2
+
+    hashcodes = array("Q", bytes(8 * n))
+    cy.encode_many_cython(lngs, lats, dim, hashcodes)
+    x = array("Q", bytes(8 * n))
+    y = array("Q", bytes(8 * n))
+    cy.hash2xy_many_cython(hashcodes, dim, x, y)
+    xy2hash = array("Q", bytes(8 * n))
+    cy.xy2hash_many_cython(x, y, dim, xy2hash)
+    decoded_lngs = array("d", bytes(8 * n))
+    decoded_lats = array("d", bytes(8 * n))
+    cy.decode_many_cython(hashcodes, dim, decoded_lngs, decoded_lats)
+
+    assert hashcodes == xy2hash
+    for i in range(n):
+        xi, yi = hilbert._coord2int(lngs[i], lats[i], dim)
+        assert (xi, yi) == (x[i], y[i])
+        assert hilbert._xy2hash(xi, yi, dim) == hashcodes[i]
+        assert hilbert._int2coord(xi, yi, dim) == (decoded_lngs[i], decoded_lats[i])
+
+    with pytest.raises(ValueError):
+        cy.encode_many_cython(lngs, lats[1:], dim, hashcodes)
+    with pytest.raises(ValueError):
+        cy.encode_many_cython(array("d", [181]), array("d", [0]), dim, hashcodes[:1])
+    with pytest.raises(ValueError):
+        cy.hash2xy_many_cython(hashcodes, dim, x[1:], y)
+    with pytest.raises(ValueError):
+        cy.xy2hash_many_cython(x, y, dim, xy2hash[1:])
+    with pytest.raises(ValueError):
+        cy.decode_many_cython(hashcodes, dim, decoded_lngs, decoded_lats[1:])
+
+
+@pytest.mark.parametrize("level", (1, 5, 16, 30, 32, 33))
+def test_encode_decode_ints(level):
+    dim = 1 << level
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+
+    hashcodes = hilbert._encode_ints(lngs, lats, level)
+    assert list(hashcodes) == list(hilbert._encode_ints(array("d", lngs), lats, level))
+    assert [
+        hilbert._xy2hash(*hilbert._coord2int(lng, lat, dim), dim)
+        for lng, lat in zip(lngs, lats)
+    ] == list(hashcodes)
+
+    decoded_lngs, decoded_lats = hilbert._decode_ints(hashcodes, level)
+    assert [
+        hilbert._int2coord(*hilbert._hash2xy(hashcode, dim), dim)
+        for hashcode in hashcodes
+    ] == list(zip(decoded_lngs, decoded_lats))
+
+
+@pytest.mark.parametrize("cython", (False, True))
+@pytest.mark.parametrize("level", (16, 33))
+def test_encode_ints_out_of_range(monkeypatch, cython, level):
+    if cython and not hilbert.CYTHON_AVAILABLE:
+        pytest.skip("needs cython kernels")
+    monkeypatch.setattr(hilbert, "CYTHON_AVAILABLE", cython)
+
+    for lng, lat in ((180.5, 0), (-181, 0), (0, 90.5), (0, -91)):
+        with pytest.raises(ValueError):
+            hilbert._encode_ints([0, lng], [0, lat], level)
+    with pytest.raises(ValueError):
+        hilbert._encode_ints([0, 1], [0], level)
+
+    assert 2 == len(hilbert._encode_ints([-180, 180], [-90, 90], level))
+
+
+@pytest.mark.skipif(not hilbert.CYTHON_AVAILABLE, reason="needs cython kernels")
+def test_cython_lookup_ranges():
+    from geohash_hilbert import _hilbert_cython as cy
+
+    starts = array("Q", [10, 20, 40])
+    lasts = array("Q", [14, 29, 2**64 - 1])
+    indices = array("q", [7, 8, 9])
+    hashcodes = array("Q", [0, 10, 14, 15, 19, 20, 29, 30, 40, 2**64 - 1])
+
+    out = array("q", [-1]) * len(hashcodes)
+    out[1] = 3  # already set entries are kept
+    cy.lookup_ranges_cython(hashcodes, starts, lasts, indices, out)
+    assert [-1, 3, 7, -1, -1, 8, 8, -1, 9, 9] == list(out)
+
+    with pytest.raises(ValueError):
+        cy.lookup_ranges_cython(hashcodes, starts, lasts, indices, out[1:])
+    with pytest.raises(ValueError):
+        cy.lookup_ranges_cython(hashcodes, starts, lasts[1:], indices, out)
@@ -0,0 +1,68 @@
+from random import random
+
+import pytest
+
+from geohash_hilbert import encode, spatial_join
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_spatial_join(bpc):
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+    # cells of mixed precisions
+    codes = sorted(
+        {
+            encode(lng, lat, 1 + i % 4, bpc)
+            for i, (lng, lat) in enumerate(zip(lngs, lats))
+        }
+    )[::3]
+
+    result = spatial_join(lngs, lats, codes, bits_per_char=bpc)
+    assert len(lngs) == len(result)
+
+    for lng, lat, idx in zip(lngs, lats, result):
+        containing = [
+            i
+            for i, code in enumerate(codes)
+            if encode(lng, lat, len(code), bpc) == code
+        ]
+        if not containing:
+            assert -1 == idx
+        else:
+            # finest cell wins
+            assert max(containing, key=lambda i: len(codes[i])) == idx
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_spatial_join_edge_cases(bpc):
+    assert [-1, -1] == list(spatial_join([0, 1], [0, 1], [], bits_per_char=bpc))
+    assert [] == list(spatial_join([], [], ["0"], bits_per_char=bpc))
+
+    # the empty code covers the whole world
+    assert [0, 0] == list(spatial_join([-180, 180], [-90, 90], [""], bits_per_char=bpc))
+
+    # first duplicate wins
+    code = encode(6.957036, 50.941291, 3, bpc)
+    assert [1] == list(
+        spatial_join([6.957036], [50.941291], ["", code, code], bits_per_char=bpc)
+    )
+
+    # 64 bit and more, with the whole world as fallback
+    for prec in (64 // bpc, 64 // bpc + 1):
+        code = encode(6.957036, 50.941291, prec, bpc)
+        assert [1, 0] == list(
+            spatial_join(
+                [6.957036, -73.985656], [50.941291, 40.748433], ["", code], bpc
+            )
+        )
+
+    with pytest.raises(ValueError):
+        spatial_join([0, 1], [0], [""], bits_per_char=bpc)
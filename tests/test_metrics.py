@@ -0,0 +1,107 @@
+from array import array
+from math import pi
+from random import random
+
+import pytest
+
+from geohash_hilbert import (
+    cell_areas,
+    decode_exactly,
+    encode,
+    grid_distances,
+    haversine_distances,
+    neighbours,
+)
+from geohash_hilbert._int2str import encode_int
+from geohash_hilbert._metrics import EARTH_RADIUS
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_haversine_distances(bpc):
+    cologne = encode(6.957036, 50.941291, 60 // bpc, bpc)
+    new_york = encode(-73.985656, 40.748433, 60 // bpc, bpc)
+    equator = encode(0, 0, 60 // bpc, bpc)
+    antipode = encode(180, 0, 60 // bpc, bpc)
+
+    distances = haversine_distances(
+        [cologne, cologne, new_york, equator],
+        [cologne, new_york, cologne, antipode],
+        bpc,
+    )
+    assert 0 == distances[0]
+    assert 6_050_000 == pytest.approx(distances[1], abs=5_000)
+    assert distances[1] == distances[2]
+    assert pi * EARTH_RADIUS == pytest.approx(distances[3])
+
+    unit = haversine_distances([cologne], [new_york], bpc, radius=1)
+    assert distances[1] == pytest.approx(unit[0] * EARTH_RADIUS)
+
+    with pytest.raises(ValueError):
+        haversine_distances([cologne], [], bpc)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", (1, 2))
+def test_cell_areas(bpc, prec):
+    codes = [encode_int(i, bpc).rjust(prec, "0") for i in range(1 << (prec * bpc))]
+    areas = cell_areas(codes, bpc)
+
+    # the cells cover the whole earth
+    assert 4 * pi * EARTH_RADIUS**2 == pytest.approx(sum(areas))
+    assert 4 * pi == pytest.approx(sum(cell_areas(codes, bpc, radius=1)))
+
+    # cells shrink towards the poles
+    for code, area in zip(codes, areas):
+        _lng, lat, _lng_err, _lat_err = decode_exactly(code, bpc)
+        polar = encode(0, 89.9 if lat > 0 else -89.9, prec, bpc)
+        assert area >= cell_areas([polar], bpc)[0]
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", range(2, 7))
+def test_grid_distances(bpc, prec):
+    for _i in range(20):
+        code = encode(rand_lng(), rand_lat(), prec, bpc)
+        others = [
+            n
+            for n in neighbours(code, bpc).values()
+            # no wrapping around the globe
+            if abs(decode_exactly(n, bpc)[0] - decode_exactly(code, bpc)[0]) < 180
+        ]
+
+        assert [0] == list(grid_distances([code], [code], bpc))
+        assert [1] * len(others) == list(
+            grid_distances([code] * len(others), others, bpc)
+        )
+
+    west = encode(-180, 0, prec, bpc)
+    east = encode(180, 0, prec, bpc)
+    dim = 1 << ((prec * bpc) >> 1)
+    assert [dim - 1] == list(grid_distances([west], [east], bpc))
+
+    with pytest.raises(ValueError):
+        grid_distances([west], [east[:-1]], bpc)
+    with pytest.raises(ValueError):
+        grid_distances([west], [], bpc)
+
+
+def test_grid_distances_mixed_and_large():
+    codes_a = [encode(-180, 0, prec, 6) for prec in (2, 10, 21, 22)]
+    codes_b = [encode(180, 0, prec, 6) for prec in (2, 10, 21, 22)]
+    dims = [1 << ((prec * 6) >> 1) for prec in (2, 10, 21, 22)]
+
+    distances = grid_distances(codes_a, codes_b)
+    assert isinstance(distances, list)  # level 66 exceeds 64 bit
+    assert [dim - 1 for dim in dims] == distances
+
+    distances = grid_distances(codes_a[:3], codes_b[:3])
+    assert isinstance(distances, array)  # up to level 63
+    assert [dim - 1 for dim in dims[:3]] == list(distances)
@@ -0,0 +1,85 @@
+from collections import Counter
+from random import gauss, random
+
+import pytest
+
+from geohash_hilbert import Partitioner, encode
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("n", (1, 2, 7, 16))
+def test_balanced(bpc, n):
+    # a dense city and some countryside
+    lngs = [min(180, max(-180, gauss(6.95, 0.1))) for _i in range(900)]
+    lats = [min(90, max(-90, gauss(50.94, 0.1))) for _i in range(900)]
+    lngs += [rand_lng() for _i in range(100)]
+    lats += [rand_lat() for _i in range(100)]
+
+    prec = 60 // bpc
+    partitioner = Partitioner.from_points(
+        lngs, lats, n, precision=prec, bits_per_char=bpc
+    )
+    assert n == len(partitioner)
+
+    counts = Counter(
+        partitioner.partition_of_point(lng, lat) for lng, lat in zip(lngs, lats)
+    )
+    assert set(counts) <= set(range(n))
+    assert all(abs(count - 1000 / n) <= 1 for count in counts.values())
+
+    for lng, lat in zip(lngs, lats):
+        code = encode(lng, lat, prec, bpc)
+        assert partitioner.partition_of(code) == partitioner.partition_of_point(
+            lng, lat
+        )
+        # partitions are contiguous ranges
+        assert partitioner.partition_of(code[:3]) <= partitioner.partition_of(code)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_from_codes(bpc):
+    codes = set()
+    while len(codes) < 1000:
+        codes.add(encode(rand_lng(), rand_lat(), 8, bpc))
+    partitioner = Partitioner.from_codes(codes, 4, bits_per_char=bpc)
+
+    assert 3 == len(partitioner.splits)
+    assert 8 == partitioner.precision
+    assert [250] * 4 == [
+        count
+        for _p, count in sorted(Counter(map(partitioner.partition_of, codes)).items())
+    ]
+
+
+def test_coarse_codes():
+    partitioner = Partitioner(["Z7fe00"], 6)
+    assert 1 == partitioner.partition_of("Z7fe")  # starts at the split point
+    assert 1 == partitioner.partition_of("Z7fe00")
+    assert 1 == partitioner.partition_of("Z7fe00aIVO")
+    assert 0 == partitioner.partition_of("Z7fd")
+    assert 0 == partitioner.partition_of("Z7fdzz")
+    assert 1 == partitioner.partition_of("Z7ff")
+
+
+def test_json():
+    partitioner = Partitioner.from_codes(["a", "b", "c", "d"], 2)
+    assert ["c"] == partitioner.splits
+    assert partitioner == Partitioner.from_json(partitioner.to_json())
+    assert partitioner != Partitioner(["b"], 1)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        Partitioner(["b", "a"])
+    with pytest.raises(ValueError):
+        Partitioner.from_codes([], 2)
+    with pytest.raises(ValueError):
+        Partitioner.from_points([0, 1], [0], 2)
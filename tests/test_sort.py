@@ -0,0 +1,132 @@
+from array import array
+from random import random
+
+import pytest
+
+from geohash_hilbert import (
+    encode,
+    hilbert_argsort,
+    hilbert_argsort_external,
+    hilbert_sort,
+    hilbert_sort_external,
+)
+from geohash_hilbert import _sort as sort
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("level", (1, 5, 30, 33))
+def test_hilbert_argsort(level):
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+
+    codes = [encode(lng, lat, level, bits_per_char=2) for lng, lat in zip(lngs, lats)]
+    expected = sorted(range(len(codes)), key=codes.__getitem__)  # stable
+
+    assert expected == list(hilbert_argsort(lngs, lats, level))
+    assert expected == list(hilbert_argsort(array("d", lngs), array("d", lats), level))
+
+    with pytest.raises(ValueError):
+        hilbert_argsort(lngs, lats[1:], level)
+
+
+def test_hilbert_sort():
+    lngs = array("d", [rand_lng() for _i in range(1000)])
+    lats = [rand_lat() for _i in range(1000)]
+    payload = list(range(1000))
+    original = list(zip(lngs, lats))
+
+    order = hilbert_argsort(lngs, lats, 16)
+    hilbert_sort(lngs, lats, payload, level=16)
+
+    assert isinstance(lngs, array)
+    assert list(order) == payload
+    assert [original[i] for i in order] == list(zip(lngs, lats))
+
+    with pytest.raises(ValueError):
+        hilbert_sort(lngs, lats, payload[1:])
+
+
+@pytest.mark.parametrize("chunk_size", (1, 99, 1000, 5000))
+@pytest.mark.parametrize("level", (0, 16, 32))
+def test_hilbert_argsort_external(tmp_path, chunk_size, level):
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+
+    result = hilbert_argsort_external(
+        iter(lngs), iter(lats), level, chunk_size=chunk_size, tmpdir=str(tmp_path)
+    )
+    assert list(hilbert_argsort(lngs, lats, level)) == list(result)
+    assert [] == list(tmp_path.iterdir())  # cleaned up
+
+    assert [] == list(hilbert_argsort_external([], [], level))
+
+    with pytest.raises(ValueError):
+        list(hilbert_argsort_external(lngs, lats[1:], level, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", (1, 99, 1000, 5000))
+def test_hilbert_sort_external(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(sort, "_MAX_FAN_IN", 3)  # several merge passes
+    lngs = [rand_lng() for _i in range(1000)]
+    lats = [rand_lat() for _i in range(1000)]
+    payload = [f"p{i}" for i in range(1000)]
+    order = hilbert_argsort(lngs, lats, 16)
+
+    result = hilbert_sort_external(
+        iter(lngs),
+        iter(lats),
+        iter(payload),
+        range(1000),
+        level=16,
+        chunk_size=chunk_size,
+        tmpdir=str(tmp_path),
+    )
+    assert [(lngs[i], lats[i], payload[i], i) for i in order] == list(result)
+    assert [] == list(tmp_path.iterdir())  # cleaned up
+
+    result = hilbert_sort_external(lngs, lats, level=16, chunk_size=chunk_size)
+    assert [(lngs[i], lats[i]) for i in order] == list(result)
+    assert [] == list(hilbert_sort_external([], [], [], level=16))
+
+    with pytest.raises(ValueError):
+        list(hilbert_sort_external(lngs, lats, payload[1:], chunk_size=chunk_size))
+    with pytest.raises(ValueError):
+        list(hilbert_sort_external(lngs, lats, payload + ["x"], chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("columns", ((), ([f"p{i}" for i in range(300)],)))
+def test_external_open_files(monkeypatch, columns):
+    opened = []
+    max_open = 0
+
+    def tracking_open(*args, **kwargs):
+        nonlocal max_open
+        opened.append(open(*args, **kwargs))  # noqa: SIM115 (closed by sort)
+        max_open = max(max_open, sum(not fp.closed for fp in opened))
+        return opened[-1]
+
+    monkeypatch.setattr(sort, "open", tracking_open, raising=False)
+    monkeypatch.setattr(sort, "_MAX_FAN_IN", 4)
+    lngs = [rand_lng() for _i in range(300)]
+    lats = [rand_lat() for _i in range(300)]
+    order = hilbert_argsort(lngs, lats, 16)
+
+    result = hilbert_sort_external(lngs, lats, *columns, level=16, chunk_size=2)
+    assert [(lngs[i], lats[i], *(c[i] for c in columns)) for i in order] == list(result)
+    # 150 runs are merged 4 at a time into 1 run; with a rows file per run
+    assert 10 == max_open
+    assert all(fp.closed for fp in opened)
+
+    opened.clear()
+    max_open = 0
+    result = hilbert_argsort_external(lngs, lats, 16, chunk_size=2)
+    assert list(order) == list(result)
+    assert 5 == max_open  # no rows files
+    assert all(fp.closed for fp in opened)
@@ -0,0 +1,148 @@
+from itertools import chain
+from random import random
+
+import pytest
+
+from geohash_hilbert import (
+    compact_codes,
+    encode,
+    intersect_codes,
+    merge_codes,
+    union_codes,
+    unique_codes,
+)
+from geohash_hilbert._int2str import encode_int
+from geohash_hilbert._stream import _ALPHABETS
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+def rand_codes(n, bpc, precisions):
+    return sorted(
+        encode(
+            rand_lng(),
+            rand_lat(),
+            precision=precisions[i % len(precisions)],
+            bits_per_char=bpc,
+        )
+        for i in range(n)
+    )
+
+
+def covers(codes, code):
+    return any(code.startswith(c) for c in codes)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_merge_unique(bpc):
+    runs = [rand_codes(100, bpc, (1, 2, 3)) for _i in range(5)]
+
+    merged = list(merge_codes(*(iter(run) for run in runs)))
+    assert sorted(chain.from_iterable(runs)) == merged
+
+    assert sorted(set(merged)) == list(unique_codes(merged))
+    assert [] == list(unique_codes([]))
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_union(bpc):
+    runs = [rand_codes(100, bpc, (1, 2, 3)) for _i in range(3)]
+    union = list(union_codes(*runs))
+
+    assert sorted(union) == union
+    # disjoint
+    for i, code in enumerate(union):
+        assert not covers(union[:i] + union[i + 1 :], code)
+    # same area
+    for code in chain.from_iterable(runs):
+        assert covers(union, code)
+    for code in union:
+        assert any(code in run for run in runs)
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_intersect(bpc):
+    left = rand_codes(200, bpc, (1, 2))
+    right = rand_codes(200, bpc, (2, 3))
+    intersection = list(intersect_codes(left, right))
+
+    assert sorted(intersection) == intersection
+    for code in intersection:
+        assert covers(left, code)
+        assert covers(right, code)
+
+    for code in rand_codes(1000, bpc, (4,)):
+        assert covers(intersection, code) == (
+            covers(left, code) and covers(right, code)
+        )
+
+    assert [] == list(intersect_codes(left, []))
+    assert list(union_codes(left)) == list(intersect_codes(left, [""]))
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_compact(bpc):
+    alphabet = _ALPHABETS[bpc]
+    # all children of `a`, all grandchildren of `b1`, and some of `c`
+    a, b, c = alphabet[1], alphabet[2], alphabet[3]
+    codes = sorted(
+        [a + ch for ch in alphabet]
+        + [b + alphabet[1] + ch for ch in alphabet]
+        + [c + ch for ch in alphabet[1:]]
+        + [a + alphabet[0] + alphabet[0]]  # covered
+    )
+
+    assert [a, b + alphabet[1]] + [c + ch for ch in alphabet[1:]] == list(
+        compact_codes(codes, bpc)
+    )
+
+    # the whole world
+    world = [ch + ch2 for ch in alphabet for ch2 in alphabet]
+    assert [""] == list(compact_codes(world, bpc))
+
+    assert [] == list(compact_codes([], bpc))
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_compact_random(bpc):
+    codes = rand_codes(2000, bpc, (1, 2))
+    compact = list(compact_codes(codes, bpc))
+
+    assert sorted(compact) == compact
+    assert len(compact) <= len(set(codes))
+    for code in rand_codes(1000, bpc, (3,)):
+        assert covers(compact, code) == covers(codes, code)
+
+
+@pytest.mark.parametrize("bpc, prec", ((2, 8), (4, 5)))
+def test_compact_bounded_memory(bpc, prec):
+    alphabet = _ALPHABETS[bpc]
+    parent = alphabet[0] * 2
+    # one shallow cell and deep incomplete cells under the same parent
+    deep = [
+        parent + alphabet[1] + encode_int(i, bpc).rjust(prec - 3, "0")
+        for i in range(1 << ((prec - 3) * bpc))
+        if i % len(alphabet) != 0
+    ]
+    codes = [parent + alphabet[0]] + deep
+
+    consumed = 0
+
+    def stream():
+        nonlocal consumed
+        for code in codes:
+            consumed += 1
+            yield code
+
+    result = []
+    for code in compact_codes(stream(), bpc):
+        result.append(code)
+        assert consumed - len(result) <= prec * len(alphabet)
+
+    assert codes == result
@@ -0,0 +1,84 @@
+from array import array
+from random import random
+
+import pytest
+
+from geohash_hilbert import Grid, Tracker, encode
+
+
+def rand_lng():
+    return random() * 360 - 180
+
+
+def rand_lat():
+    return random() * 180 - 90
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("prec", (1, 3, 10, 40))
+def test_tracker(bpc, prec):
+    tracker = Tracker(prec, bpc)
+    positions = {entity: (rand_lng(), rand_lat()) for entity in range(100)}
+
+    events = tracker.update_many(
+        list(positions),
+        [p[0] for p in positions.values()],
+        [p[1] for p in positions.values()],
+    )
+    assert [
+        (entity, None, encode(lng, lat, prec, bpc))
+        for entity, (lng, lat) in positions.items()
+    ] == events
+    assert 100 == len(tracker)
+
+    for _i in range(1000):
+        entity = int(random() * 100)
+        lng, lat = positions[entity]
+        # mostly small moves
+        lng = min(180, max(-180, lng + (random() - 0.5) * 1e-3))
+        lat = min(90, max(-90, lat + (random() - 0.5) * 1e-3))
+        positions[entity] = lng, lat
+
+        previous = tracker.cell(entity)
+        code = encode(lng, lat, prec, bpc)
+        event = tracker.update(entity, lng, lat)
+        if previous == code:
+            assert event is None
+        else:
+            assert (entity, previous, code) == event
+        assert code == tracker.cell(entity)
+
+
+def test_remove():
+    tracker = Tracker(6, grid=Grid(5.8, 47.2, 15.1, 55.1))
+    tracker.update("a", 6.957036, 50.941291)
+    tracker.update("b", 13.404954, 52.520008)
+    tracker.update("c", 11.576124, 48.137154)
+
+    code = tracker.cell("a")
+    assert code == tracker.remove("a")
+    assert "a" not in tracker
+    assert "c" in tracker
+    assert 2 == len(tracker)
+    assert tracker.cell("c") == encode(
+        11.576124, 48.137154, 6, grid=tracker.encoder.grid
+    )
+    assert tracker.update("c", 11.576124, 48.137154) is None
+
+    tracker.remove("c")
+    tracker.remove("b")
+    assert 0 == len(tracker)
+    assert ("a", None, code) == tracker.update("a", 6.957036, 50.941291)
+
+    with pytest.raises(KeyError):
+        tracker.remove("b")
+    with pytest.raises(KeyError):
+        tracker.cell("b")
+    with pytest.raises(ValueError):
+        tracker.update_many(["a"], [1, 2], [1])
+
+
+def test_storage():
+    assert isinstance(Tracker(10, 6)._hashcodes, array)  # level 30
+    assert isinstance(Tracker(16, 4)._hashcodes, array)  # level 32
+    assert isinstance(Tracker(11, 6)._hashcodes, list)  # level 33
@@ -1,3 +1,5 @@
+from io import StringIO
+import json
 from random import random
 
 import pytest
@@ -93,6 +95,47 @@ def test_rectangle(bpc, prec):
     assert (lng - lng_err, lat - lat_err) == coords[0][4]  # lower left
 
 
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+def test_bboxes(bpc):
+    codes = [
+        encode(rand_lng(), rand_lat(), bits_per_char=bpc, precision=prec)
+        for prec in range(1, 7)
+        for _i in range(10)
+    ]
+
+    bboxes = utils.bboxes(codes, bits_per_char=bpc)
+    assert 4 * len(codes) == len(bboxes)
+    for i, code in enumerate(codes):
+        assert utils.rectangle(code, bits_per_char=bpc)["bbox"] == tuple(
+            bboxes[4 * i : 4 * i + 4]
+        )
+
+
+@pytest.mark.parametrize("bpc", (2, 4, 6))
+@pytest.mark.parametrize("chunk_size", (1, 7, 4096))
+def test_write_rectangles(bpc, chunk_size):
+    codes = [
+        encode(rand_lng(), rand_lat(), bits_per_char=bpc, precision=prec)
+        for prec in range(1, 7)
+        for _i in range(10)
+    ]
+
+    fp = StringIO()
+    assert len(codes) == utils.write_rectangles(
+        iter(codes), fp, bits_per_char=bpc, chunk_size=chunk_size
+    )
+
+    expected = {
+        "type": "FeatureCollection",
+        "features": [utils.rectangle(code, bits_per_char=bpc) for code in codes],
+    }
+    assert json.loads(json.dumps(expected)) == json.loads(fp.getvalue())
+
+    fp = StringIO()
+    assert 0 == utils.write_rectangles([], fp, bits_per_char=bpc)
+    assert {"type": "FeatureCollection", "features": []} == json.loads(fp.getvalue())
+
+
 @pytest.mark.parametrize("bpc", (2, 4, 6))
 @pytest.mark.parametrize("prec", range(1, 4))
 def test_hilbert_curve(bpc, prec):